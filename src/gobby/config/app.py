@@ -496,6 +496,11 @@ class MessageTrackingConfig(BaseModel):
         default=5.0,
         description="Polling interval in seconds for transcript updates",
     )
+    use_file_watcher: bool = Field(
+        default=True,
+        description="Process transcripts on filesystem change events instead of fixed-interval "
+        "polling (poll_interval then acts as a fallback rescan interval)",
+    )
     debounce_delay: float = Field(
         default=1.0,
         description="Debounce delay in seconds for message processing",
@@ -9,6 +9,7 @@ Provides a stdio-based MCP server that:
 """
 
 import asyncio
+import atexit
 import logging
 import os
 import subprocess
@@ -355,6 +356,9 @@ def create_stdio_mcp_server() -> FastMCP:
 
         # Wire up change listener for automatic export in this process too
         task_manager.add_change_listener(sync_manager.trigger_export)
+        sync_manager.start()
+        # Flush a still-debounced export when the process exits
+        atexit.register(sync_manager.stop)
 
         # Create task registry for internal tools (LLM tools proxied to daemon)
         internal_manager.add_registry(create_task_registry(task_manager, sync_manager))
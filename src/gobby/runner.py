@@ -77,6 +77,7 @@ class GobbyRunner:
             self.message_processor = SessionMessageProcessor(
                 db=self.database,
                 poll_interval=self.config.message_tracking.poll_interval,
+                use_file_watcher=self.config.message_tracking.use_file_watcher,
             )
 
         # Session Lifecycle Manager (background jobs for expiring and processing)
@@ -127,6 +128,9 @@ class GobbyRunner:
         try:
             self._setup_signal_handlers()
 
+            # Debounce task exports triggered from worker threads on this loop
+            self.task_sync_manager.start()
+
             # Connect MCP servers
             try:
                 await asyncio.wait_for(self.mcp_proxy.connect_all(), timeout=10.0)
@@ -174,6 +178,8 @@ class GobbyRunner:
             if self.message_processor:
                 await self.message_processor.stop()
 
+            self.task_sync_manager.stop()
+
             if websocket_task:
                 websocket_task.cancel()
                 try:
@@ -8,16 +8,61 @@ Tracks file offsets and updates the database with new messages.
 import asyncio
 import logging
 import os
-
+import time
 
 from gobby.servers.websocket import WebSocketServer
 from gobby.sessions.transcripts import get_parser
-from gobby.sessions.transcripts.base import TranscriptParser
+from gobby.sessions.transcripts.base import ParsedMessage, TranscriptParser
 from gobby.storage.database import LocalDatabase
 from gobby.storage.messages import LocalMessageManager
 
+try:
+    from watchfiles import awatch
+except ImportError:  # pragma: no cover - watchfiles ships with uvicorn[standard]
+    awatch = None
+
 logger = logging.getLogger(__name__)
 
+# Maximum number of read batches waiting to be parsed and stored
+_INGEST_QUEUE_SIZE = 256
+
+# (session_id, new_lines, byte_offset, last_index, file_stat, done)
+_IngestBatch = tuple[
+    str, list[str], int, int, tuple[int, int], "asyncio.Future[list[ParsedMessage]]"
+]
+
+
+def _read_new_lines(transcript_path: str, offset: int) -> tuple[list[str], int]:
+    """
+    Read complete lines from a transcript starting at a byte offset.
+
+    Blocking; intended to be run in a worker thread via ``asyncio.to_thread``.
+
+    Args:
+        transcript_path: Path to the transcript JSONL file
+        offset: Byte offset to start reading from
+
+    Returns:
+        Tuple of (complete lines read, byte offset just past the last complete line)
+    """
+    with open(transcript_path, "rb") as f:
+        # Seek to last known position and read the whole tail at once
+        f.seek(offset)
+        blob = f.read()
+
+    # Only process complete lines; a trailing partial line means a write is in progress
+    last_newline = blob.rfind(b"\n")
+    if last_newline < 0:
+        return [], offset
+
+    # Decode the whole block in one pass. Split on "\n" only: str.splitlines() would
+    # also break on U+2028/U+2029, which JSON permits unescaped inside strings.
+    text = blob[:last_newline].decode("utf-8")
+    new_lines = [line + "\n" for line in text.split("\n")]
+    valid_offset = offset + last_newline + 1
+
+    return new_lines, valid_offset
+
 
 class SessionMessageProcessor:
     """
@@ -34,34 +79,59 @@ class SessionMessageProcessor:
         db: LocalDatabase,
         poll_interval: float = 2.0,
         websocket_server: WebSocketServer | None = None,
+        use_file_watcher: bool = True,
     ):
         self.db = db
         self.message_manager = LocalMessageManager(db)
         self.poll_interval = poll_interval
         self.websocket_server = websocket_server
 
+        # Wake on filesystem events when watchfiles is available; poll_interval then
+        # only bounds how long a missed event can go unnoticed.
+        self.use_file_watcher = use_file_watcher and awatch is not None
+
         # Track active sessions: session_id -> transcript_path
         self._active_sessions: dict[str, str] = {}
 
         # Track parsers: session_id -> TranscriptParser
-        # Currently hardcoded to ClaudeTranscriptParser, but could support others
+        # Parsers are stateless, so sessions from the same source share one instance
         self._parsers: dict[str, TranscriptParser] = {}
+        self._parser_by_source: dict[str, TranscriptParser] = {}
+
+        # Transcript (size, mtime_ns) as of the last completed pass: session_id -> stat
+        # Lets idle sessions be skipped with a single stat() call
+        self._stat_cache: dict[str, tuple[int, int]] = {}
+
+        # Transcript reads are decoupled from parse + DB write: readers enqueue batches
+        # and a single writer task drains them, so reads overlap with commits.
+        self._ingest_queue: asyncio.Queue[_IngestBatch] = asyncio.Queue(maxsize=_INGEST_QUEUE_SIZE)
+        self._writer_task: asyncio.Task | None = None
 
         self._running = False
         self._task: asyncio.Task | None = None
 
+        # Set to restart the file watcher when a new transcript directory appears.
+        # register_session() may run on worker threads, so it is set via _watch_loop_ref.
+        self._watch_restart: asyncio.Event | None = None
+        self._watch_loop_ref: asyncio.AbstractEventLoop | None = None
+
     async def start(self) -> None:
         """Start the processing loop."""
         if self._running:
             return
 
         self._running = True
-        self._task = asyncio.create_task(self._loop())
+        if self.use_file_watcher:
+            self._task = asyncio.create_task(self._watch_loop())
+        else:
+            self._task = asyncio.create_task(self._loop())
         logger.info("SessionMessageProcessor started")
 
     async def stop(self) -> None:
         """Stop the processing loop."""
         self._running = False
+        if self._watch_restart:
+            self._watch_restart.set()
         if self._task:
             self._task.cancel()
             try:
@@ -69,6 +139,7 @@ class SessionMessageProcessor:
             except asyncio.CancelledError:
                 pass
             self._task = None
+        await self._stop_writer()
         logger.info("SessionMessageProcessor stopped")
 
     def register_session(
@@ -90,8 +161,16 @@ class SessionMessageProcessor:
             # We still register it, hoping it appears later (or we could fail)
             # For now, let's assume it might be created shortly.
 
+        new_dir = os.path.dirname(transcript_path) not in self._watched_dirs()
+
         self._active_sessions[session_id] = transcript_path
-        self._parsers[session_id] = get_parser(source)
+        parser = self._parser_by_source.get(source)
+        if parser is None:
+            parser = self._parser_by_source[source] = get_parser(source)
+        self._parsers[session_id] = parser
+
+        if new_dir:
+            self._request_watch_restart()
         logger.debug(f"Registered session {session_id} for processing ({source})")
 
     def unregister_session(self, session_id: str) -> None:
@@ -100,36 +179,168 @@ class SessionMessageProcessor:
             del self._active_sessions[session_id]
             if session_id in self._parsers:
                 del self._parsers[session_id]
+            self._stat_cache.pop(session_id, None)
             logger.debug(f"Unregistered session {session_id}")
 
+    def _ensure_writer(self) -> None:
+        """Start the ingest writer task if it is not already running."""
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = asyncio.create_task(self._writer())
+
+    async def _stop_writer(self) -> None:
+        """Stop the ingest writer and fail any batches still waiting in the queue."""
+        if self._writer_task:
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+            self._writer_task = None
+
+        while not self._ingest_queue.empty():
+            *_, done = self._ingest_queue.get_nowait()
+            done.cancel()
+            self._ingest_queue.task_done()
+
+    async def _writer(self) -> None:
+        """Parse and store queued batches one at a time, in arrival order."""
+        while True:
+            batch = await self._ingest_queue.get()
+            session_id, new_lines, byte_offset, last_index, file_stat, done = batch
+            try:
+                stored = await self._store_batch(
+                    session_id, new_lines, byte_offset, last_index, file_stat
+                )
+            except Exception as e:
+                if not done.done():
+                    done.set_exception(e)
+            else:
+                if not done.done():
+                    done.set_result(stored)
+            finally:
+                self._ingest_queue.task_done()
+
     async def _loop(self) -> None:
         """Main processing loop."""
         while self._running:
+            await self._loop_once()
+            await asyncio.sleep(self.poll_interval)
+
+    def _request_watch_restart(self) -> None:
+        """Ask the file watcher to re-read its directories. Safe from any thread."""
+        event = self._watch_restart
+        loop = self._watch_loop_ref
+        if event is None or loop is None or loop.is_closed():
+            return
+        loop.call_soon_threadsafe(event.set)
+
+    async def _watch_loop(self) -> None:
+        """
+        Event-driven processing loop backed by watchfiles.
+
+        Watches the directories containing registered transcripts and processes
+        only the sessions whose files changed. A full pass (and a check for new
+        transcript directories) still runs at least every poll_interval, even
+        while unrelated files in a watched directory keep changing, covering
+        files that did not exist yet when the watch started.
+        """
+        assert awatch is not None
+        timeout_ms = int(self.poll_interval * 1000)
+        self._watch_loop_ref = asyncio.get_running_loop()
+        last_full = time.monotonic()
+
+        while self._running:
+            dirs = self._watchable_dirs()
+            if not dirs:
+                await self._loop_once()
+                await asyncio.sleep(self.poll_interval)
+                continue
+
+            self._watch_restart = asyncio.Event()
             try:
-                await self._process_all_sessions()
+                async for changes in awatch(
+                    *dirs,
+                    stop_event=self._watch_restart,
+                    rust_timeout=timeout_ms,
+                    yield_on_timeout=True,
+                    # Bound batching delay so busy directories still yield each interval
+                    debounce=min(1600, timeout_ms),
+                    recursive=False,
+                ):
+                    if changes:
+                        changed = {os.path.realpath(path) for _, path in changes}
+                        await self._process_sessions(
+                            [
+                                (session_id, transcript_path)
+                                for session_id, transcript_path in list(
+                                    self._active_sessions.items()
+                                )
+                                if os.path.realpath(transcript_path) in changed
+                            ]
+                        )
+
+                    if not changes or time.monotonic() - last_full >= self.poll_interval:
+                        last_full = time.monotonic()
+                        await self._loop_once()
+                        if self._watchable_dirs() != dirs:
+                            # A transcript directory appeared or went away; re-watch
+                            self._watch_restart.set()
             except Exception as e:
-                logger.error(f"Error in SessionMessageProcessor loop: {e}")
+                logger.error(f"Error watching transcripts, retrying: {e}")
+                await asyncio.sleep(self.poll_interval)
 
-            await asyncio.sleep(self.poll_interval)
+    async def _loop_once(self) -> None:
+        """Run a single full pass, logging rather than raising errors."""
+        try:
+            await self._process_all_sessions()
+        except Exception as e:
+            logger.error(f"Error in SessionMessageProcessor loop: {e}")
+
+    def _watched_dirs(self) -> set[str]:
+        """Directories containing the registered transcript files."""
+        # Snapshot first: register_session() may mutate the dict from another thread
+        return {os.path.dirname(path) for path in list(self._active_sessions.values())}
+
+    def _watchable_dirs(self) -> list[str]:
+        """Registered transcript directories that currently exist, in stable order."""
+        return sorted(d for d in self._watched_dirs() if os.path.isdir(d))
 
     async def _process_all_sessions(self) -> None:
         """Process all registered sessions."""
         # Create list copy to avoid concurrent modification issues
-        sessions = list(self._active_sessions.items())
+        await self._process_sessions(list(self._active_sessions.items()))
+
+    async def _process_sessions(self, sessions: list[tuple[str, str]]) -> None:
+        """Process the given (session_id, transcript_path) pairs concurrently."""
+        # Process concurrently so one slow transcript doesn't delay the rest
+        results = await asyncio.gather(
+            *(
+                self._process_session(session_id, transcript_path)
+                for session_id, transcript_path in sessions
+            ),
+            return_exceptions=True,
+        )
 
-        for session_id, transcript_path in sessions:
-            try:
-                await self._process_session(session_id, transcript_path)
-            except Exception as e:
-                logger.error(f"Failed to process session {session_id}: {e}")
+        for (session_id, _), result in zip(sessions, results, strict=True):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to process session {session_id}: {result}")
 
     async def _process_session(self, session_id: str, transcript_path: str) -> None:
         """
         Process a single session.
 
-        Reads new lines from the transcript file from the last known byte offset.
+        Reads new lines from the transcript file from the last known byte offset and
+        queues them for the writer. Once they have been stored, broadcasts the new
+        messages from this task so slow websocket clients never hold up the writer.
+        Skips the session entirely if the transcript is unchanged since the last pass.
         """
-        if not os.path.exists(transcript_path):
+        try:
+            st = os.stat(transcript_path)
+        except OSError:
+            return
+
+        file_stat = (st.st_size, st.st_mtime_ns)
+        if self._stat_cache.get(session_id) == file_stat:
             return
 
         # Get current processing state
@@ -142,42 +353,53 @@ class SessionMessageProcessor:
             last_offset = state.get("last_byte_offset", 0)
             last_index = state.get("last_message_index", -1)
 
-        # Read new content
-        new_lines = []
-        valid_offset = last_offset
+        if st.st_size < last_offset:
+            # File was truncated or replaced; start over from the beginning
+            logger.info(f"Transcript {transcript_path} shrank, re-reading from start")
+            last_offset = 0
 
+        # Read new content off the event loop so slow disks don't stall other sessions
         try:
-            # Note: synchronous file I/O for simplicity; could use aiofiles if blocking is an issue
-            # but reading incremental logs is usually fast.
-            with open(transcript_path, "r", encoding="utf-8") as f:
-                # Seek to last known position
-                f.seek(last_offset)
-
-                # Read line by line
-                while True:
-                    line = f.readline()
-                    if not line:
-                        break
-
-                    # Only process complete lines
-                    if line.endswith("\n"):
-                        new_lines.append(line)
-                        valid_offset = f.tell()
-                    else:
-                        # Incomplete line (write in progress), stop reading
-                        break
-
+            new_lines, valid_offset = await asyncio.to_thread(
+                _read_new_lines, transcript_path, last_offset
+            )
         except Exception as e:
             logger.error(f"Error reading transcript {transcript_path}: {e}")
             return
 
         if not new_lines:
+            self._stat_cache[session_id] = file_stat
             return
 
-        # Parse new lines
+        # Hand parsing and storage to the writer; a full queue applies backpressure
+        self._ensure_writer()
+        done: asyncio.Future[list[ParsedMessage]] = asyncio.get_running_loop().create_future()
+        await self._ingest_queue.put(
+            (session_id, new_lines, valid_offset, last_index, file_stat, done)
+        )
+        stored = await done
+
+        await self._broadcast_messages(session_id, stored)
+
+        logger.debug(f"Processed {len(stored)} messages for {session_id}")
+
+    async def _store_batch(
+        self,
+        session_id: str,
+        new_lines: list[str],
+        byte_offset: int,
+        last_index: int,
+        file_stat: tuple[int, int],
+    ) -> list[ParsedMessage]:
+        """
+        Parse a batch of transcript lines and store the resulting messages.
+
+        Returns:
+            The messages stored
+        """
         parser = self._parsers.get(session_id)
         if not parser:
-            return
+            return []
 
         parsed_messages = parser.parse_lines(new_lines, start_index=last_index + 1)
 
@@ -186,17 +408,27 @@ class SessionMessageProcessor:
             # We still update the offset so we don't re-read them endlessly
             await self.message_manager.update_state(
                 session_id=session_id,
-                byte_offset=valid_offset,
+                byte_offset=byte_offset,
                 message_index=last_index,
             )
-            return
+            self._stat_cache[session_id] = file_stat
+            return []
 
-        # Store messages
-        await self.message_manager.store_messages(session_id, parsed_messages)
+        # Store messages and advance the offset in one transaction
+        await self.message_manager.store_and_advance(
+            session_id=session_id,
+            messages=parsed_messages,
+            byte_offset=byte_offset,
+            message_index=parsed_messages[-1].index,
+        )
 
-        # Broadcast new messages
+        self._stat_cache[session_id] = file_stat
+        return parsed_messages
+
+    async def _broadcast_messages(self, session_id: str, messages: list[ParsedMessage]) -> None:
+        """Broadcast newly stored messages to websocket clients."""
         if self.websocket_server:
-            for msg in parsed_messages:
+            for msg in messages:
                 payload = {
                     "type": "session_message",
                     "session_id": session_id,
@@ -210,14 +442,3 @@ class SessionMessageProcessor:
                     },
                 }
                 await self.websocket_server.broadcast(payload)
-
-        # Update state
-        new_last_index = parsed_messages[-1].index
-
-        await self.message_manager.update_state(
-            session_id=session_id,
-            byte_offset=valid_offset,
-            message_index=new_last_index,
-        )
-
-        logger.debug(f"Processed {len(parsed_messages)} messages for {session_id}")
@@ -13,6 +13,10 @@ logger = logging.getLogger(__name__)
 # Default database path
 DEFAULT_DB_PATH = Path.home() / ".gobby" / "gobby.db"
 
+# Per-connection prepared statement cache; sized well above the number of
+# distinct statements the storage managers issue so hot paths never re-parse.
+_STATEMENT_CACHE_SIZE = 256
+
 
 class LocalDatabase:
     """
@@ -43,6 +47,7 @@ class LocalDatabase:
                 str(self.db_path),
                 check_same_thread=False,
                 isolation_level=None,  # Autocommit mode
+                cached_statements=_STATEMENT_CACHE_SIZE,
             )
             self._local.connection.row_factory = sqlite3.Row
             # Enable foreign keys
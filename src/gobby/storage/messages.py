@@ -11,6 +11,51 @@ from gobby.storage.database import LocalDatabase
 
 logger = logging.getLogger(__name__)
 
+_UPSERT_MESSAGE_SQL = """
+INSERT INTO session_messages (
+    session_id, message_index, role, content, content_type,
+    tool_name, tool_input, tool_result, timestamp, raw_json
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(session_id, message_index) DO UPDATE SET
+    content=excluded.content,
+    tool_result=excluded.tool_result,
+    timestamp=excluded.timestamp,
+    raw_json=excluded.raw_json
+"""
+
+_UPSERT_STATE_SQL = """
+INSERT INTO session_message_state (
+    session_id, last_byte_offset, last_message_index,
+    last_processed_at, updated_at
+) VALUES (?, ?, ?, datetime('now'), datetime('now'))
+ON CONFLICT(session_id) DO UPDATE SET
+    last_byte_offset=excluded.last_byte_offset,
+    last_message_index=excluded.last_message_index,
+    last_processed_at=excluded.last_processed_at,
+    updated_at=excluded.updated_at
+"""
+
+
+def _message_row(session_id: str, msg: ParsedMessage) -> tuple[Any, ...]:
+    """Build the session_messages parameter tuple for a parsed message."""
+    # Convert dicts to JSON strings for storage
+    tool_input = json.dumps(msg.tool_input) if msg.tool_input else None
+    tool_result = json.dumps(msg.tool_result) if msg.tool_result else None
+    raw_json = json.dumps(msg.raw_json) if msg.raw_json else None
+
+    return (
+        session_id,
+        msg.index,
+        msg.role,
+        msg.content,
+        msg.content_type,
+        msg.tool_name,
+        tool_input,
+        tool_result,
+        msg.timestamp.isoformat(),
+        raw_json,
+    )
+
 
 class LocalMessageManager:
     """Manages storage of session messages and processing state."""
@@ -35,38 +80,7 @@ class LocalMessageManager:
         count = 0
         try:
             for msg in messages:
-                # Convert dicts to JSON strings for storage
-                tool_input = json.dumps(msg.tool_input) if msg.tool_input else None
-                tool_result = json.dumps(msg.tool_result) if msg.tool_result else None
-                raw_json = json.dumps(msg.raw_json) if msg.raw_json else None
-
-                query = """
-                INSERT INTO session_messages (
-                    session_id, message_index, role, content, content_type,
-                    tool_name, tool_input, tool_result, timestamp, raw_json
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(session_id, message_index) DO UPDATE SET
-                    content=excluded.content,
-                    tool_result=excluded.tool_result,
-                    timestamp=excluded.timestamp,
-                    raw_json=excluded.raw_json
-                """
-
-                self.db.execute(
-                    query,
-                    (
-                        session_id,
-                        msg.index,
-                        msg.role,
-                        msg.content,
-                        msg.content_type,
-                        msg.tool_name,
-                        tool_input,
-                        tool_result,
-                        msg.timestamp.isoformat(),
-                        raw_json,
-                    ),
-                )
+                self.db.execute(_UPSERT_MESSAGE_SQL, _message_row(session_id, msg))
                 count += 1
 
             return count
@@ -137,18 +151,39 @@ class LocalMessageManager:
             byte_offset: New byte offset in source file
             message_index: Index of last processed message
         """
-        sql = """
-        INSERT INTO session_message_state (
-            session_id, last_byte_offset, last_message_index,
-            last_processed_at, updated_at
-        ) VALUES (?, ?, ?, datetime('now'), datetime('now'))
-        ON CONFLICT(session_id) DO UPDATE SET
-            last_byte_offset=excluded.last_byte_offset,
-            last_message_index=excluded.last_message_index,
-            last_processed_at=excluded.last_processed_at,
-            updated_at=excluded.updated_at
-        """
-        self.db.execute(sql, (session_id, byte_offset, message_index))
+        self.db.execute(_UPSERT_STATE_SQL, (session_id, byte_offset, message_index))
+
+    async def store_and_advance(
+        self,
+        session_id: str,
+        messages: list[ParsedMessage],
+        byte_offset: int,
+        message_index: int,
+    ) -> int:
+        """
+        Store parsed messages and update processing state in a single transaction.
+
+        Args:
+            session_id: ID of the session
+            messages: List of ParsedMessage objects
+            byte_offset: New byte offset in source file
+            message_index: Index of last processed message
+
+        Returns:
+            Number of messages stored
+        """
+        try:
+            with self.db.transaction() as conn:
+                if messages:
+                    conn.executemany(
+                        _UPSERT_MESSAGE_SQL, [_message_row(session_id, msg) for msg in messages]
+                    )
+                conn.execute(_UPSERT_STATE_SQL, (session_id, byte_offset, message_index))
+            return len(messages)
+
+        except Exception as e:
+            logger.error(f"Failed to store messages for session {session_id}: {e}")
+            raise
 
     async def count_messages(self, session_id: str) -> int:
         """
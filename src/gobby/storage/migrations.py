@@ -374,6 +374,22 @@ MIGRATIONS: list[tuple[int, str, str]] = [
             WHERE status = 'expired' AND transcript_processed = FALSE;
         """,
     ),
+    (
+        17,
+        "Add integer created_at_us column to session_tasks",
+        """
+        ALTER TABLE session_tasks ADD COLUMN created_at_us INTEGER;
+
+        UPDATE session_tasks
+            SET created_at_us = CAST((julianday(created_at) - 2440587.5) * 86400000000 AS INTEGER)
+            WHERE created_at_us IS NULL;
+
+        CREATE INDEX IF NOT EXISTS idx_session_tasks_session_created
+            ON session_tasks(session_id, created_at_us);
+        CREATE INDEX IF NOT EXISTS idx_session_tasks_task_created
+            ON session_tasks(task_id, created_at_us);
+        """,
+    ),
 ]
 
 
@@ -1,5 +1,6 @@
 import logging
-from datetime import UTC, datetime
+import time
+from collections.abc import Iterable
 from typing import Any, Literal
 
 from gobby.storage.database import LocalDatabase
@@ -9,6 +10,24 @@ logger = logging.getLogger(__name__)
 
 SessionTaskAction = Literal["worked_on", "discovered", "mentioned", "closed"]
 
+# Use INSERT OR IGNORE to handle duplicate links gracefully. created_at_us is
+# the integer sort key; SQLite derives the legacy ISO created_at text from it,
+# keeping the microsecond precision of datetime.isoformat().
+_INSERT_SESSION_TASK_SQL = """
+    INSERT OR IGNORE INTO session_tasks (
+        session_id, task_id, action, created_at_us, created_at
+    ) VALUES (
+        ?1, ?2, ?3, ?4,
+        strftime('%Y-%m-%dT%H:%M:%S', ?4 / 1000000, 'unixepoch')
+            || printf('.%06d', ?4 % 1000000) || '+00:00'
+    )
+"""
+
+_DELETE_SESSION_TASK_SQL = """
+    DELETE FROM session_tasks
+    WHERE session_id = ? AND task_id = ? AND action = ?
+"""
+
 
 class SessionTaskManager:
     VALID_ACTIONS = {"worked_on", "discovered", "mentioned", "closed"}
@@ -29,20 +48,38 @@ class SessionTaskManager:
         if action not in self.VALID_ACTIONS:
             raise ValueError(f"Invalid action '{action}'. Must be one of {self.VALID_ACTIONS}")
 
-        now = datetime.now(UTC).isoformat()
+        now = time.time_ns() // 1000
 
         with self.db.transaction() as conn:
-            # Use INSERT OR IGNORE to handle duplicate links gracefully
-            conn.execute(
-                """
-                INSERT OR IGNORE INTO session_tasks (
-                    session_id, task_id, action, created_at
-                ) VALUES (?, ?, ?, ?)
-                """,
-                (session_id, task_id, action, now),
-            )
+            conn.execute(_INSERT_SESSION_TASK_SQL, (session_id, task_id, action, now))
             logger.debug(f"Linked task {task_id} to session {session_id} with action {action}")
 
+    def link_tasks(
+        self,
+        session_id: str,
+        links: Iterable[tuple[str, str]],
+    ) -> None:
+        """
+        Link several tasks to a session in a single transaction.
+
+        Args:
+            session_id: Session to link the tasks to
+            links: (task_id, action) pairs
+        """
+        links = list(links)
+        for _, action in links:
+            if action not in self.VALID_ACTIONS:
+                raise ValueError(f"Invalid action '{action}'. Must be one of {self.VALID_ACTIONS}")
+
+        now = time.time_ns() // 1000
+
+        with self.db.transaction() as conn:
+            conn.executemany(
+                _INSERT_SESSION_TASK_SQL,
+                [(session_id, task_id, action, now) for task_id, action in links],
+            )
+            logger.debug(f"Linked {len(links)} tasks to session {session_id}")
+
     def unlink_task(
         self,
         session_id: str,
@@ -51,13 +88,7 @@ class SessionTaskManager:
     ) -> None:
         """Remove a link between a task and a session."""
         with self.db.transaction() as conn:
-            conn.execute(
-                """
-                DELETE FROM session_tasks
-                WHERE session_id = ? AND task_id = ? AND action = ?
-                """,
-                (session_id, task_id, action),
-            )
+            conn.execute(_DELETE_SESSION_TASK_SQL, (session_id, task_id, action))
             logger.debug(f"Unlinked task {task_id} from session {session_id} for action {action}")
 
     def get_session_tasks(self, session_id: str) -> list[dict[str, Any]]:
@@ -70,7 +101,7 @@ class SessionTaskManager:
         FROM tasks t
         JOIN session_tasks st ON t.id = st.task_id
         WHERE st.session_id = ?
-        ORDER BY st.created_at DESC
+        ORDER BY st.created_at_us DESC
         """
         rows = self.db.fetchall(query, (session_id,))
 
@@ -92,6 +123,7 @@ class SessionTaskManager:
         """
         # Simple query that relies only on session_tasks to minimize dependencies
         rows = self.db.fetchall(
-            "SELECT * FROM session_tasks WHERE task_id = ? ORDER BY created_at DESC", (task_id,)
+            "SELECT * FROM session_tasks WHERE task_id = ? ORDER BY created_at_us DESC",
+            (task_id,),
         )
         return [dict(row) for row in rows]
@@ -4,6 +4,9 @@ from __future__ import annotations
 
 import builtins
 import logging
+import os
+import threading
+import time
 import uuid
 from dataclasses import dataclass
 from datetime import UTC, datetime
@@ -13,6 +16,32 @@ from gobby.storage.database import LocalDatabase
 
 logger = logging.getLogger(__name__)
 
+# How long get() may serve a cached session. The cache is shared by every
+# manager in the process, so writes through any of them invalidate immediately;
+# the TTL only bounds staleness from writes made outside LocalSessionManager
+# (other processes or raw SQL against the same database file).
+_SESSION_CACHE_TTL = 2.0
+_SESSION_CACHE_SIZE = 1024
+
+# (database key, session_id) -> (expiry on the monotonic clock, session).
+# Misses are not cached.
+_SESSION_CACHE: dict[tuple[str, str], tuple[float, Session]] = {}
+# Bumped on every invalidation. get() only caches a row if no invalidation
+# happened while it was reading, so a read racing a write can't cache the old row.
+_SESSION_CACHE_GENERATION = 0
+_SESSION_CACHE_LOCK = threading.Lock()
+
+
+def _invalidate_session_cache(key: tuple[str, str] | None = None) -> None:
+    """Drop one cached session, or all of them when no key is given."""
+    global _SESSION_CACHE_GENERATION
+    with _SESSION_CACHE_LOCK:
+        _SESSION_CACHE_GENERATION += 1
+        if key is None:
+            _SESSION_CACHE.clear()
+        else:
+            _SESSION_CACHE.pop(key, None)
+
 
 @dataclass
 class Session:
@@ -79,6 +108,16 @@ class LocalSessionManager:
     def __init__(self, db: LocalDatabase):
         """Initialize with database connection."""
         self.db = db
+        # Managers over the same database file share cache entries; each in-memory
+        # database is distinct, so those are keyed by instance
+        db_path = str(db.db_path)
+        self._cache_db_key = (
+            f"{db_path}#{id(db)}" if db_path == ":memory:" else os.path.realpath(db_path)
+        )
+
+    def _invalidate(self, session_id: str) -> None:
+        """Drop a session from the read cache after it has been written."""
+        _invalidate_session_cache((self._cache_db_key, session_id))
 
     def register(
         self,
@@ -145,12 +184,44 @@ class LocalSessionManager:
         )
 
         # Return the session (either newly created or existing)
-        return self.find_current(external_id, machine_id, source)  # type: ignore
+        session = self.find_current(external_id, machine_id, source)
+        if session:
+            self._invalidate(session.id)
+        return session  # type: ignore
 
     def get(self, session_id: str) -> Session | None:
-        """Get session by ID."""
+        """Get session by ID, served from a short-lived cache when fresh."""
+        now = time.monotonic()
+        key = (self._cache_db_key, session_id)
+        cached = _SESSION_CACHE.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+
+        generation = _SESSION_CACHE_GENERATION
         row = self.db.fetchone("SELECT * FROM sessions WHERE id = ?", (session_id,))
-        return Session.from_row(row) if row else None
+        if not row:
+            self._invalidate(session_id)
+            return None
+
+        session = Session.from_row(row)
+        with _SESSION_CACHE_LOCK:
+            if generation == _SESSION_CACHE_GENERATION:
+                if len(_SESSION_CACHE) >= _SESSION_CACHE_SIZE:
+                    _SESSION_CACHE.clear()
+                _SESSION_CACHE[key] = (now + _SESSION_CACHE_TTL, session)
+        return session
+
+    def get_parent_summary(self, session_id: str) -> str | None:
+        """Get the summary markdown of a session's parent in a single query."""
+        row = self.db.fetchone(
+            """
+            SELECT p.summary_markdown FROM sessions c
+            JOIN sessions p ON c.parent_session_id = p.id
+            WHERE c.id = ?
+            """,
+            (session_id,),
+        )
+        return row["summary_markdown"] if row else None
 
     def find_current(
         self,
@@ -206,6 +277,7 @@ class LocalSessionManager:
             "UPDATE sessions SET status = ?, updated_at = ? WHERE id = ?",
             (status, now, session_id),
         )
+        self._invalidate(session_id)
         return self.get(session_id)
 
     def update_title(self, session_id: str, title: str) -> Session | None:
@@ -215,6 +287,7 @@ class LocalSessionManager:
             "UPDATE sessions SET title = ?, updated_at = ? WHERE id = ?",
             (title, now, session_id),
         )
+        self._invalidate(session_id)
         return self.get(session_id)
 
     def update_summary(
@@ -222,19 +295,22 @@ class LocalSessionManager:
         session_id: str,
         summary_path: str | None = None,
         summary_markdown: str | None = None,
+        status: str | None = None,
     ) -> Session | None:
-        """Update session summary."""
+        """Update session summary, optionally setting the status in the same write."""
         now = datetime.now(UTC).isoformat()
         self.db.execute(
             """
             UPDATE sessions
             SET summary_path = COALESCE(?, summary_path),
                 summary_markdown = COALESCE(?, summary_markdown),
+                status = COALESCE(?, status),
                 updated_at = ?
             WHERE id = ?
             """,
-            (summary_path, summary_markdown, now, session_id),
+            (summary_path, summary_markdown, status, now, session_id),
         )
+        self._invalidate(session_id)
         return self.get(session_id)
 
     def update_parent_session_id(self, session_id: str, parent_session_id: str) -> Session | None:
@@ -244,6 +320,7 @@ class LocalSessionManager:
             "UPDATE sessions SET parent_session_id = ?, updated_at = ? WHERE id = ?",
             (parent_session_id, now, session_id),
         )
+        self._invalidate(session_id)
         return self.get(session_id)
 
     def list(
@@ -295,6 +372,7 @@ class LocalSessionManager:
     def delete(self, session_id: str) -> bool:
         """Delete session by ID."""
         cursor = self.db.execute("DELETE FROM sessions WHERE id = ?", (session_id,))
+        self._invalidate(session_id)
         return bool(cursor.rowcount and cursor.rowcount > 0)
 
     def expire_stale_sessions(self, timeout_hours: int = 24) -> int:
@@ -319,6 +397,7 @@ class LocalSessionManager:
         )
         count = cursor.rowcount or 0
         if count > 0:
+            _invalidate_session_cache()
             logger.info(f"Expired {count} stale sessions (>{timeout_hours}h inactive)")
         return count
 
@@ -362,6 +441,7 @@ class LocalSessionManager:
             "UPDATE sessions SET transcript_processed = TRUE, updated_at = ? WHERE id = ?",
             (now, session_id),
         )
+        self._invalidate(session_id)
         return self.get(session_id)
 
     def reset_transcript_processed(self, session_id: str) -> Session | None:
@@ -379,4 +459,5 @@ class LocalSessionManager:
             "UPDATE sessions SET transcript_processed = FALSE, updated_at = ? WHERE id = ?",
             (now, session_id),
         )
+        self._invalidate(session_id)
         return self.get(session_id)
@@ -4,7 +4,7 @@ import logging
 import os
 import sqlite3
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any, Literal
@@ -409,6 +409,12 @@ class LocalTaskManager:
         rows = self.db.fetchall(query, tuple(params))
         return [Task.from_row(row) for row in rows]
 
+    def iter_tasks_sorted_by_id(self) -> Iterator[Task]:
+        """Iterate over all tasks ordered by ID without loading them all into memory."""
+        cursor = self.db.execute("SELECT * FROM tasks ORDER BY id")
+        for row in cursor:
+            yield Task.from_row(row)
+
     def list_ready_tasks(
         self,
         project_id: str | None = None,
@@ -1,3 +1,4 @@
+import asyncio
 import hashlib
 import json
 import logging
@@ -33,61 +34,70 @@ class TaskSyncManager:
         self.task_manager = task_manager
         self.db = task_manager.db
         self.export_path = Path(export_path)
-        self._debounce_timer: threading.Timer | None = None
         self._debounce_interval = 5.0  # seconds
 
+        # Debounced exports run on a single asyncio task bound to the daemon's event loop
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._export_event: asyncio.Event | None = None
+        self._export_task: asyncio.Task[None] | None = None
+        # Set from the first trigger until the exporter starts writing; stop() flushes it
+        self._export_pending = False
+        # Serializes writers of the export file (background exporter and direct callers)
+        self._export_lock = threading.Lock()
+
     def export_to_jsonl(self) -> None:
         """
         Export all tasks and their dependencies to a JSONL file.
         Tasks are sorted by ID to ensure deterministic output.
         """
-        try:
-            # list_tasks returns all statuses if status is not provided.
-            # Set a high limit to export all tasks.
-            tasks = self.task_manager.list_tasks(limit=100000)
+        with self._export_lock:
+            self._export_to_jsonl()
 
-            # Fetch all dependencies
-            # We'll use a raw query for efficiency here instead of calling get_blockers for every task
-            deps_rows = self.db.fetchall("SELECT task_id, depends_on FROM task_dependencies")
+    def _export_to_jsonl(self) -> None:
+        """Perform the export; caller must hold _export_lock."""
+        try:
+            # Fetch all dependencies, aggregated per task by SQLite.
+            # We'll use a raw query for efficiency here instead of calling get_blockers for every task.
+            # Deps are joined with the unit separator (char 31), which cannot appear in task IDs.
+            deps_rows = self.db.fetchall(
+                """
+                SELECT task_id, GROUP_CONCAT(depends_on, char(31)) AS deps
+                FROM task_dependencies
+                GROUP BY task_id
+                """
+            )
 
             # Build dependency map: task_id -> list[depends_on]
-            deps_map: dict[str, list[str]] = {}
-            for task_id, depends_on in deps_rows:
-                if task_id not in deps_map:
-                    deps_map[task_id] = []
-                deps_map[task_id].append(depends_on)
-
-            # Sort tasks by ID for deterministic output
-            tasks.sort(key=lambda t: t.id)
-
-            export_data = []
-            for task in tasks:
-                task_dict = {
-                    "id": task.id,
-                    "title": task.title,
-                    "description": task.description,
-                    "status": task.status,
-                    "created_at": task.created_at,
-                    "updated_at": task.updated_at,
-                    "project_id": task.project_id,
-                    "parent_id": task.parent_task_id,
-                    "deps_on": sorted(deps_map.get(task.id, [])),  # Sort deps for stability
-                }
-                export_data.append(task_dict)
+            deps_map: dict[str, list[str]] = {
+                task_id: deps.split("\x1f") for task_id, deps in deps_rows
+            }
 
-            # Write to file
+            # Stream tasks (sorted by ID for deterministic output) straight to disk,
+            # hashing each line as it is written.
+            # Keys are sorted so the file itself is the canonical form for the content hash.
             self.export_path.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(self.export_path, "w", encoding="utf-8") as f:
-                for item in export_data:
-                    f.write(json.dumps(item) + "\n")
-
-            # Calculate ID-independent content hash
-            jsonl_content = ""
-            for item in export_data:
-                jsonl_content += json.dumps(item, sort_keys=True) + "\n"
-
-            content_hash = hashlib.sha256(jsonl_content.encode("utf-8")).hexdigest()
+            hasher = hashlib.sha256()
+            task_count = 0
+            with open(self.export_path, "wb", buffering=1 << 20) as f:
+                for task in self.task_manager.iter_tasks_sorted_by_id():
+                    task_dict = {
+                        "id": task.id,
+                        "title": task.title,
+                        "description": task.description,
+                        "status": task.status,
+                        "created_at": task.created_at,
+                        "updated_at": task.updated_at,
+                        "project_id": task.project_id,
+                        "parent_id": task.parent_task_id,
+                        "deps_on": sorted(deps_map.get(task.id, [])),  # Sort deps for stability
+                    }
+                    line = (json.dumps(task_dict, sort_keys=True) + "\n").encode("utf-8")
+                    f.write(line)
+                    hasher.update(line)
+                    task_count += 1
+
+            content_hash = hasher.hexdigest()
 
             meta_path = self.export_path.parent / "tasks_meta.json"
             meta_data = {
@@ -99,7 +109,7 @@ class TaskSyncManager:
                 json.dump(meta_data, f, indent=2)
 
             logger.info(
-                f"Exported {len(tasks)} tasks to {self.export_path} (hash: {content_hash[:8]})"
+                f"Exported {task_count} tasks to {self.export_path} (hash: {content_hash[:8]})"
             )
 
         except Exception as e:
@@ -240,15 +250,68 @@ class TaskSyncManager:
         except Exception:
             return {"status": "error", "synced": False}
 
+    def start(self) -> None:
+        """
+        Bind debounced exports to the running event loop.
+
+        Call this from the event loop at startup so that triggers from worker
+        threads are debounced even before the first trigger from the loop.
+        Does nothing when no event loop is running.
+        """
+        try:
+            self._loop = asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+
     def trigger_export(self) -> None:
         """
         Trigger a debounced export.
+
+        Safe to call from the event loop or from worker threads. Outside of any
+        event loop (e.g. CLI usage) the export runs immediately instead.
         """
-        if self._debounce_timer:
-            self._debounce_timer.cancel()
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            loop = self._loop
+            if loop is None or loop.is_closed():
+                self.export_to_jsonl()
+            else:
+                loop.call_soon_threadsafe(self._schedule_export)
+            return
+
+        self._schedule_export()
+
+    def _schedule_export(self) -> None:
+        """Start the exporter task if needed and signal it. Must run on the event loop."""
+        if self._export_task is None or self._export_task.done():
+            self._loop = asyncio.get_running_loop()
+            self._export_event = asyncio.Event()
+            self._export_task = self._loop.create_task(self._exporter())
+
+        assert self._export_event is not None
+        self._export_pending = True
+        self._export_event.set()
 
-        self._debounce_timer = threading.Timer(self._debounce_interval, self.export_to_jsonl)
-        self._debounce_timer.start()
+    async def _exporter(self) -> None:
+        """Run exports one at a time, once triggers have been quiet for the debounce interval."""
+        assert self._export_event is not None
+        event = self._export_event
+
+        while True:
+            await event.wait()
+
+            # Debounce: keep waiting while new triggers arrive
+            while event.is_set():
+                event.clear()
+                await asyncio.sleep(self._debounce_interval)
+
+            self._export_pending = False
+            try:
+                await asyncio.to_thread(self.export_to_jsonl)
+            except Exception:
+                # Already logged by export_to_jsonl; keep the exporter alive
+                pass
 
     async def import_from_github_issues(
         self, repo_url: str, project_id: str | None = None, limit: int = 50
@@ -388,6 +451,15 @@ class TaskSyncManager:
             return {"success": False, "error": str(e)}
 
     def stop(self) -> None:
-        """Stop any pending timers."""
-        if self._debounce_timer:
-            self._debounce_timer.cancel()
+        """Cancel the debounced exporter, flushing any export it had not yet run."""
+        if self._export_task and not self._export_task.done():
+            self._export_task.cancel()
+        self._export_task = None
+
+        if self._export_pending:
+            self._export_pending = False
+            try:
+                self.export_to_jsonl()
+            except Exception:
+                # Already logged by export_to_jsonl
+                pass
@@ -10,9 +10,20 @@ from typing import Any
 
 from gobby.config.app import TaskExpansionConfig
 from gobby.llm import LLMService
+from gobby.utils.json_helpers import extract_json
 
 logger = logging.getLogger(__name__)
 
+_EXPAND_SYSTEM_PROMPT = "You are a technical project manager. Break down tasks effectively."
+
+_EXPAND_PROMPT_TMPL = (
+    "Break down the following task into 3-5 smaller, actionable subtasks.\n"
+    "Return ONLY a valid JSON list of objects with 'title' and 'description' keys.\n\n"
+    "Task: {title}\n"
+    "Description: {description}\n"
+    "Context: {context}"
+)
+
 
 class TaskExpander:
     """Expands tasks into subtasks using LLM."""
@@ -47,12 +58,10 @@ class TaskExpander:
         logger.info(f"Expanding task {task_id}: {title}")
 
         # Construct prompt
-        prompt = self.config.prompt or (
-            "Break down the following task into 3-5 smaller, actionable subtasks.\n"
-            "Return ONLY a valid JSON list of objects with 'title' and 'description' keys.\n\n"
-            f"Task: {title}\n"
-            f"Description: {description or 'None'}\n"
-            f"Context: {context or 'None'}"
+        prompt = self.config.prompt or _EXPAND_PROMPT_TMPL.format(
+            title=title,
+            description=description or "None",
+            context=context or "None",
         )
 
         try:
@@ -60,26 +69,12 @@ class TaskExpander:
             provider = self.llm_service.get_provider(self.config.provider)
             response_content = await provider.generate_text(
                 prompt=prompt,
-                system_prompt="You are a technical project manager. Break down tasks effectively.",
+                system_prompt=_EXPAND_SYSTEM_PROMPT,
                 model=self.config.model,
             )
 
-            # Parse response (expected to be JSON list)
-            # In a real implementation, we'd need robust JSON parsing here
-            # For now, we assume the LLM follows instructions or we use a structured output parser
-            # This is a placeholder for the actual parsing logic
-            import json
-
-            content = response_content.strip()
-            # Handle potential markdown code blocks
-            if content.startswith("```"):
-                content = content.split("\n", 1)[1]
-                if content.endswith("```"):
-                    content = content.rsplit("\n", 1)[0]
-                if content.startswith("json"):
-                    content = content[4:].strip()
-
-            subtasks = json.loads(content)
+            # Parse response (expected to be JSON list, possibly fenced)
+            subtasks = extract_json(response_content)
 
             if not isinstance(subtasks, list):
                 logger.warning(f"LLM returned non-list for task expansion: {type(subtasks)}")
@@ -11,9 +11,21 @@ from typing import Literal
 
 from gobby.config.app import TaskValidationConfig
 from gobby.llm import LLMService
+from gobby.utils.json_helpers import extract_json
 
 logger = logging.getLogger(__name__)
 
+_VALIDATE_SYSTEM_PROMPT = "You are a QA engineer. Validate work strictly against requirements."
+
+_VALIDATE_PROMPT_TMPL = (
+    "Validate if the following changes satisfy the original instruction.\n"
+    "Return ONLY a valid JSON object with 'status' ('valid' or 'invalid') "
+    "and 'feedback' (string explanation).\n\n"
+    "Original Instruction: {original_instruction}\n"
+    "Task: {title}\n"
+    "Changes:\n{changes_summary}"
+)
+
 
 @dataclass
 class ValidationResult:
@@ -58,34 +70,21 @@ class TaskValidator:
 
         logger.info(f"Validating task {task_id}: {title}")
 
-        prompt = self.config.prompt or (
-            "Validate if the following changes satisfy the original instruction.\n"
-            "Return ONLY a valid JSON object with 'status' ('valid' or 'invalid') "
-            "and 'feedback' (string explanation).\n\n"
-            f"Original Instruction: {original_instruction}\n"
-            f"Task: {title}\n"
-            f"Changes:\n{changes_summary}"
+        prompt = self.config.prompt or _VALIDATE_PROMPT_TMPL.format(
+            original_instruction=original_instruction,
+            title=title,
+            changes_summary=changes_summary,
         )
 
         try:
             provider = self.llm_service.get_provider(self.config.provider)
             response_content = await provider.generate_text(
                 prompt=prompt,
-                system_prompt="You are a QA engineer. Validate work strictly against requirements.",
+                system_prompt=_VALIDATE_SYSTEM_PROMPT,
                 model=self.config.model,
             )
 
-            import json
-
-            content = response_content.strip()
-            if content.startswith("```"):
-                content = content.split("\n", 1)[1]
-                if content.endswith("```"):
-                    content = content.rsplit("\n", 1)[0]
-                if content.startswith("json"):
-                    content = content[4:].strip()
-
-            result_data = json.loads(content)
+            result_data = extract_json(response_content)
 
             return ValidationResult(
                 status=result_data.get("status", "pending"), feedback=result_data.get("feedback")
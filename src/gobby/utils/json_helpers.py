@@ -0,0 +1,37 @@
+"""Helpers for parsing JSON out of LLM responses."""
+
+import json
+import re
+from typing import Any
+
+# Leading ```/```json and trailing ``` markdown fences around the whole response
+_FENCE_RE = re.compile(r"^```(?:json)?[ \t]*\n?|\n?```$")
+
+# Outermost JSON object or array embedded in surrounding prose
+_JSON_SPAN_RE = re.compile(r"\{.*\}|\[.*\]", re.DOTALL)
+
+
+def extract_json(content: str) -> Any:
+    """
+    Parse a JSON value from an LLM response.
+
+    Strips markdown code fences and, if the remainder still isn't valid JSON,
+    falls back to the outermost object or array found in the text.
+
+    Args:
+        content: Raw LLM response text
+
+    Returns:
+        The decoded JSON value
+
+    Raises:
+        json.JSONDecodeError: If no valid JSON can be found
+    """
+    text = _FENCE_RE.sub("", content.strip()).strip()
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        match = _JSON_SPAN_RE.search(text)
+        if not match:
+            raise
+        return json.loads(match.group(0))
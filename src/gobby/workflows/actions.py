@@ -1,15 +1,90 @@
+import asyncio
+import fnmatch
+import glob
+import json
 import logging
-from dataclasses import dataclass
+import os
+import re
+import subprocess
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Protocol
 
 from gobby.storage.database import LocalDatabase
-from gobby.storage.sessions import LocalSessionManager
-from gobby.storage.tasks import LocalTaskManager  # noqa: F401
+from gobby.storage.sessions import LocalSessionManager, Session
+from gobby.storage.tasks import LocalTaskManager
 from gobby.workflows.definitions import WorkflowState
+from gobby.workflows.state_manager import WorkflowStateManager
 from gobby.workflows.templates import TemplateEngine
 
 logger = logging.getLogger(__name__)
 
+# Sentinel for handler lookups, compared by identity
+_MISSING: Any = object()
+
+# Sources understood by inject_context; the first two read the parent's summary
+_SUMMARY_SOURCES = frozenset({"previous_session_summary", "handoff"})
+_INJECT_CONTEXT_SOURCES = _SUMMARY_SOURCES | {"artifacts", "observations", "workflow_state"}
+
+
+# Last match per absolute glob pattern, revalidated on use so deleted files fall
+# back to a fresh glob. Misses are never cached: artifacts often appear later.
+_GLOB_MATCH_CACHE: dict[str, str] = {}
+_GLOB_MATCH_CACHE_SIZE = 512
+
+_GLOB_MAGIC_RE = re.compile(r"[*?[]")
+
+
+def _scan_first_match(dirname: str, name_pattern: str) -> str | None:
+    """
+    Return the first entry of a single directory whose name matches a pattern.
+
+    Equivalent to globbing ``dirname/name_pattern`` when only the last component
+    contains wildcards, but scans the directory once and stops at the first hit.
+    """
+    include_hidden = name_pattern.startswith(".")
+    try:
+        with os.scandir(dirname or os.curdir) as entries:
+            for entry in entries:
+                if entry.name.startswith(".") and not include_hidden:
+                    continue
+                if fnmatch.fnmatch(entry.name, name_pattern):
+                    return os.path.join(dirname, entry.name)
+    except OSError:
+        pass
+    return None
+
+
+def _first_glob_match(pattern: str) -> str | None:
+    """
+    Return the resolved path of the first file matching a glob pattern.
+
+    Flat patterns (wildcards only in the last component) scan one directory;
+    others use a lazy iterator so a recursive (``**``) pattern stops walking the
+    tree at the first hit. Blocking; run via ``asyncio.to_thread`` from handlers.
+    """
+    key = pattern if os.path.isabs(pattern) else os.path.join(os.getcwd(), pattern)
+    cached = _GLOB_MATCH_CACHE.get(key)
+    if cached is not None and os.path.exists(cached):
+        return cached
+
+    dirname, name_pattern = os.path.split(pattern)
+    flat = "**" not in name_pattern and not _GLOB_MAGIC_RE.search(dirname)
+    if flat and _GLOB_MAGIC_RE.search(name_pattern):
+        match = _scan_first_match(dirname, name_pattern)
+    else:
+        match = next(glob.iglob(pattern, recursive=True), None)
+    if match is None:
+        _GLOB_MATCH_CACHE.pop(key, None)
+        return None
+
+    path = os.path.realpath(match)
+    if len(_GLOB_MATCH_CACHE) >= _GLOB_MATCH_CACHE_SIZE:
+        _GLOB_MATCH_CACHE.clear()
+    _GLOB_MATCH_CACHE[key] = path
+    return path
+
 
 @dataclass
 class ActionContext:
@@ -24,6 +99,34 @@ class ActionContext:
     transcript_processor: Any | None = None
     config: Any | None = None
     mcp_manager: Any | None = None
+    _session_cache: dict[str, Session | None] = field(default_factory=dict, init=False, repr=False)
+
+    def get_session(self, session_id: str) -> Session | None:
+        """Get a session, memoized for the lifetime of this context."""
+        if session_id not in self._session_cache:
+            self._session_cache[session_id] = self.session_manager.get(session_id)
+        return self._session_cache[session_id]
+
+    @property
+    def current_session(self) -> Session | None:
+        """The session this context belongs to, loaded at most once."""
+        return self.get_session(self.session_id)
+
+    @property
+    def render_context(self) -> dict[str, Any]:
+        """Base variables available to every template rendered for this context."""
+        return {
+            "session": self.current_session,
+            "state": self.state,
+            "artifacts": self.state.artifacts,
+            "observations": self.state.observations,
+            "phase_action_count": self.state.phase_action_count,
+            "variables": self.state.variables or {},
+        }
+
+    def invalidate_session(self, session_id: str) -> None:
+        """Forget a cached session after it has been modified."""
+        self._session_cache.pop(session_id, None)
 
 
 class ActionHandler(Protocol):
@@ -53,6 +156,8 @@ class ActionExecutor:
         self.config = config
         self.mcp_manager = mcp_manager
         self._handlers: dict[str, ActionHandler] = {}
+        # Read-only view used by execute(); reflects later register() calls
+        self._dispatch = MappingProxyType(self._handlers)
         self._register_defaults()
 
     def register(self, name: str, handler: ActionHandler) -> None:
@@ -61,42 +166,68 @@ class ActionExecutor:
 
     def _register_defaults(self) -> None:
         """Register built-in actions."""
-        self.register("inject_context", self._handle_inject_context)
-        self.register("inject_message", self._handle_inject_message)
-        self.register("capture_artifact", self._handle_capture_artifact)
-        self.register("generate_handoff", self._handle_generate_handoff)
-        self.register("generate_summary", self._handle_generate_summary)
-        self.register("find_parent_session", self._handle_find_parent_session)
-        self.register("restore_context", self._handle_restore_context)
-        self.register("mark_session_status", self._handle_mark_session_status)
-        self.register("switch_mode", self._handle_switch_mode)
-        self.register("read_artifact", self._handle_read_artifact)
-        self.register("load_workflow_state", self._handle_load_workflow_state)
-        self.register("save_workflow_state", self._handle_save_workflow_state)
-        self.register("set_variable", self._handle_set_variable)
-        self.register("increment_variable", self._handle_increment_variable)
-        self.register("call_llm", self._handle_call_llm)
-        self.register("synthesize_title", self._handle_synthesize_title)
-        self.register("write_todos", self._handle_write_todos)
-        self.register("mark_todo_complete", self._handle_mark_todo_complete)
-        self.register("persist_tasks", self._handle_persist_tasks)
-        self.register("call_mcp_tool", self._handle_call_mcp_tool)
+        # Update in place so the _dispatch view stays bound to the same dict
+        self._handlers.update(
+            {
+                "inject_context": self._handle_inject_context,
+                "inject_message": self._handle_inject_message,
+                "capture_artifact": self._handle_capture_artifact,
+                "generate_handoff": self._handle_generate_handoff,
+                "generate_summary": self._handle_generate_summary,
+                "find_parent_session": self._handle_find_parent_session,
+                "restore_context": self._handle_restore_context,
+                "mark_session_status": self._handle_mark_session_status,
+                "switch_mode": self._handle_switch_mode,
+                "read_artifact": self._handle_read_artifact,
+                "load_workflow_state": self._handle_load_workflow_state,
+                "save_workflow_state": self._handle_save_workflow_state,
+                "set_variable": self._handle_set_variable,
+                "increment_variable": self._handle_increment_variable,
+                "call_llm": self._handle_call_llm,
+                "synthesize_title": self._handle_synthesize_title,
+                "write_todos": self._handle_write_todos,
+                "mark_todo_complete": self._handle_mark_todo_complete,
+                "persist_tasks": self._handle_persist_tasks,
+                "call_mcp_tool": self._handle_call_mcp_tool,
+            }
+        )
 
     async def execute(
         self, action_type: str, context: ActionContext, **kwargs
     ) -> dict[str, Any] | None:
         """Execute an action."""
-        handler = self._handlers.get(action_type)
-        if not handler:
-            logger.warning(f"Unknown action type: {action_type}")
+        handler = self._dispatch.get(action_type, _MISSING)
+        if handler is _MISSING:
+            logger.warning("Unknown action type: %s", action_type)
             return None
 
         try:
             return await handler(context, **kwargs)
         except Exception as e:
-            logger.error(f"Error executing action {action_type}: {e}", exc_info=True)
+            logger.exception("Error executing action %s", action_type)
             return {"error": str(e)}
 
+    async def execute_many(
+        self, specs: list[tuple[str, dict[str, Any]]], context: ActionContext
+    ) -> list[dict[str, Any] | None | BaseException]:
+        """
+        Execute independent actions concurrently.
+
+        Only for actions with no ordering or data dependency between them; results
+        of one action are not visible to the others.
+
+        Args:
+            specs: (action_type, kwargs) pairs
+            context: Context shared by all actions
+
+        Returns:
+            Results in the order of specs
+        """
+        return await asyncio.gather(
+            *(self.execute(action_type, context, **kwargs) for action_type, kwargs in specs),
+            return_exceptions=True,
+        )
+
     # --- Action Implementations ---
 
     async def _handle_inject_context(
@@ -109,21 +240,15 @@ class ActionExecutor:
         source = kwargs.get("source")
         if not source:
             return None
+        if source not in _INJECT_CONTEXT_SOURCES:
+            logger.debug("inject_context: unknown source %s", source)
+            return None
 
         content = ""
 
-        if source in ["previous_session_summary", "handoff"]:
-            # 1. Find current session to get external/machine/project info to find parent
-            current_session = context.session_manager.get(context.session_id)
-            if not current_session:
-                logger.warning(f"Session {context.session_id} not found")
-                return None
-
-            # Find parent manually if not linked
-            if current_session.parent_session_id:
-                parent = context.session_manager.get(current_session.parent_session_id)
-                if parent and parent.summary_markdown:
-                    content = parent.summary_markdown
+        if source in _SUMMARY_SOURCES:
+            # Read the linked parent's summary directly; no summary means nothing to inject
+            content = context.session_manager.get_parent_summary(context.session_id) or ""
 
         elif source == "artifacts":
             # List captured artifacts
@@ -136,8 +261,6 @@ class ActionExecutor:
         elif source == "observations":
             # Format observations
             if context.state.observations:
-                import json
-
                 content = "## Observations\n" + json.dumps(context.state.observations, indent=2)
 
         elif source == "workflow_state":
@@ -148,23 +271,16 @@ class ActionExecutor:
             except AttributeError:
                 state_dict = context.state.dict(exclude={"observations", "artifacts"})
 
-            import json
-
             content = "## Workflow State\n" + json.dumps(state_dict, indent=2, default=str)
 
         if content:
             # Render content if template is used
             template = kwargs.get("template")
             if template:
-                render_context = {
-                    "session": context.session_manager.get(context.session_id),
-                    "state": context.state,
-                    "artifacts": context.state.artifacts,
-                    "observations": context.state.observations,
-                }
+                render_context = context.render_context
 
                 # Add source data to context
-                if source in ["previous_session_summary", "handoff"]:
+                if source in _SUMMARY_SOURCES:
                     render_context["summary"] = content
                     # Handoff implies structured access, but we only have text summary for now.
                     # We can shim it.
@@ -194,16 +310,8 @@ class ActionExecutor:
         if not content:
             return None
 
-        render_context: dict[str, Any] = {
-            "session": context.session_manager.get(context.session_id),
-            "state": context.state,
-            "artifacts": context.state.artifacts,
-            "phase_action_count": context.state.phase_action_count,
-            "variables": context.state.variables or {},
-        }
-
         # Add any extra kwargs as context?
-        render_context.update(kwargs)
+        render_context = {**context.render_context, **kwargs}
 
         rendered_content = context.template_engine.render(content, render_context)
 
@@ -225,9 +333,6 @@ class ActionExecutor:
         if not pattern:
             return None
 
-        import glob
-        import os
-
         # Security check: Ensure pattern is relative and within allowed paths?
         # For now, assume agent has access to CWD.
 
@@ -240,14 +345,11 @@ class ActionExecutor:
         # Let's assume the YAML parser maps 'as' to something else or we get it from kwargs.
         save_as = kwargs.get("as")
 
-        matches = glob.glob(pattern, recursive=True)
-        if not matches:
-            return None
-
         # Just grab the first match for now if multiple, or list?
         # If 'as' is provided, we map a single file.
-
-        filepath = os.path.abspath(matches[0])
+        filepath = await asyncio.to_thread(_first_glob_match, pattern)
+        if not filepath:
+            return None
 
         if save_as:
             context.state.artifacts[save_as] = filepath
@@ -264,9 +366,6 @@ class ActionExecutor:
         if not pattern:
             return None
 
-        import glob
-        import os
-
         variable_name = kwargs.get("as")
         if not variable_name:
             logger.warning("read_artifact: 'as' argument missing")
@@ -277,9 +376,7 @@ class ActionExecutor:
 
         if not filepath:
             # Try as glob pattern
-            matches = glob.glob(pattern, recursive=True)
-            if matches:
-                filepath = os.path.abspath(matches[0])
+            filepath = await asyncio.to_thread(_first_glob_match, pattern)
 
         if not filepath or not os.path.exists(filepath):
             logger.warning(f"read_artifact: File not found for pattern '{pattern}'")
@@ -303,8 +400,6 @@ class ActionExecutor:
         self, context: ActionContext, **kwargs
     ) -> dict[str, Any] | None:
         """Load workflow state from DB."""
-        from .state_manager import WorkflowStateManager
-
         state_manager = WorkflowStateManager(context.db)
         loaded_state = state_manager.get_state(context.session_id)
 
@@ -327,8 +422,6 @@ class ActionExecutor:
         self, context: ActionContext, **kwargs
     ) -> dict[str, Any] | None:
         """Save workflow state to DB."""
-        from .state_manager import WorkflowStateManager
-
         state_manager = WorkflowStateManager(context.db)
         state_manager.save_state(context.state)
         return {"state_saved": True}
@@ -378,13 +471,8 @@ class ActionExecutor:
             return {"error": "Missing LLM service"}
 
         # Render prompt template
-        render_context = {
-            "session": context.session_manager.get(context.session_id),
-            "state": context.state,
-            "variables": context.state.variables or {},
-        }
         # Add kwargs to context
-        render_context.update(kwargs)
+        render_context = {**context.render_context, **kwargs}
 
         rendered_prompt = context.template_engine.render(prompt, render_context)
 
@@ -421,7 +509,7 @@ class ActionExecutor:
         if not context.llm_service or not context.transcript_processor:
             return {"error": "Missing services"}
 
-        current_session = context.session_manager.get(context.session_id)
+        current_session = context.current_session
         if not current_session:
             return {"error": "Session not found"}
 
@@ -431,9 +519,6 @@ class ActionExecutor:
             return {"error": "No transcript path"}
 
         try:
-            import json
-            from pathlib import Path
-
             # Read enough turns to get context
             turns = []
             path = Path(transcript_path)
@@ -464,6 +549,7 @@ class ActionExecutor:
             title = title.strip().strip('"').strip("'")
 
             context.session_manager.update_title(context.session_id, title)
+            context.invalidate_session(context.session_id)
             return {"title_synthesized": title}
 
         except Exception as e:
@@ -473,8 +559,6 @@ class ActionExecutor:
     async def _handle_write_todos(self, context: ActionContext, **kwargs) -> dict[str, Any] | None:
         """Write todos to a file (default TODO.md)."""
         todos = kwargs.get("todos", [])
-        import os
-
         filename = kwargs.get("filename", "TODO.md")
 
         # Security: Allow only relative paths?
@@ -505,8 +589,6 @@ class ActionExecutor:
         todo_text = kwargs.get("todo_text")
         if not todo_text:
             return {"error": "Missing todo_text"}
-        import os
-
         filename = kwargs.get("filename", "TODO.md")
 
         if not os.path.exists(filename):
@@ -540,11 +622,9 @@ class ActionExecutor:
         """Persist a list of task dicts to Gobby task system."""
         tasks = kwargs.get("tasks", [])
         try:
-            from gobby.storage.tasks import LocalTaskManager
-
             task_manager = LocalTaskManager(context.db)
 
-            current_session = context.session_manager.get(context.session_id)
+            current_session = context.current_session
             project_id = current_session.project_id if current_session else "default"
 
             created_count = 0
@@ -625,17 +705,18 @@ class ActionExecutor:
         Legacy combined action: Generates summary + Marks status 'handoff_ready'.
         """
         # Reuse generate_summary logic
-        summary_result = await self._handle_generate_summary(context, **kwargs)
-        if summary_result and "error" in summary_result:
-            return summary_result
-
-        # Mark Session Status
-        context.session_manager.update_status(context.session_id, "handoff_ready")
+        summary = await self._summarize_session(context, **kwargs)
+        if isinstance(summary, dict):
+            return summary
 
-        if not summary_result:
-            return {"error": "Failed to generate summary"}
+        # Store the summary and mark the session 'handoff_ready' in a single write
+        context.session_manager.update_summary(
+            context.session_id, summary_markdown=summary, status="handoff_ready"
+        )
+        context.invalidate_session(context.session_id)
 
-        return {"handoff_created": True, "summary_length": summary_result.get("summary_length", 0)}
+        logger.info(f"Generated handoff for session {context.session_id}")
+        return {"handoff_created": True, "summary_length": len(summary)}
 
     async def _handle_generate_summary(
         self, context: ActionContext, **kwargs
@@ -643,12 +724,30 @@ class ActionExecutor:
         """
         Generate a session summary using LLM and store it in the session record.
         """
+        summary = await self._summarize_session(context, **kwargs)
+        if isinstance(summary, dict):
+            return summary
+
+        # Save to Production Location (sessions table)
+        context.session_manager.update_summary(context.session_id, summary_markdown=summary)
+        context.invalidate_session(context.session_id)
+
+        logger.info(f"Generated summary for session {context.session_id}")
+        return {"summary_generated": True, "summary_length": len(summary)}
+
+    async def _summarize_session(self, context: ActionContext, **kwargs) -> str | dict[str, Any]:
+        """
+        Summarize the session transcript using LLM.
+
+        Returns:
+            The summary markdown, or an error result dict
+        """
         # We need LLM service and transcript processor
         if not context.llm_service or not context.transcript_processor:
             logger.warning("generate_summary: Missing LLM service or transcript processor")
             return {"error": "Missing services"}
 
-        current_session = context.session_manager.get(context.session_id)
+        current_session = context.current_session
         if not current_session:
             return {"error": "Session not found"}
 
@@ -669,9 +768,6 @@ class ActionExecutor:
 
         # 1. Process Transcript
         try:
-            import json
-            from pathlib import Path
-
             # Read JSONL transcript
             transcript_file = Path(transcript_path)
             if not transcript_file.exists():
@@ -725,11 +821,7 @@ class ActionExecutor:
             logger.error(f"LLM generation failed: {e}")
             return {"error": f"LLM error: {e}"}
 
-        # 5. Save to Production Location (sessions table)
-        context.session_manager.update_summary(context.session_id, summary_markdown=summary_content)
-
-        logger.info(f"Generated summary for session {context.session_id}")
-        return {"summary_generated": True, "summary_length": len(summary_content)}
+        return summary_content
 
     async def _handle_find_parent_session(
         self, context: ActionContext, **kwargs
@@ -738,7 +830,7 @@ class ActionExecutor:
         Find and link a parent session for handoff.
         """
         logger.info(f"find_parent_session: Looking for parent for session {context.session_id}")
-        current_session = context.session_manager.get(context.session_id)
+        current_session = context.current_session
         if not current_session:
             logger.warning(f"find_parent_session: Current session {context.session_id} not found")
             return {"parent_session_found": False}
@@ -758,6 +850,7 @@ class ActionExecutor:
             logger.info(f"find_parent_session: Found parent {parent.id}, linking...")
             # Link it
             context.session_manager.update_parent_session_id(context.session_id, parent.id)
+            context.invalidate_session(context.session_id)
             logger.info(f"find_parent_session: Linked {context.session_id} -> {parent.id}")
             return {
                 "parent_session_found": True,
@@ -773,11 +866,11 @@ class ActionExecutor:
         """
         Restore context from linked parent session.
         """
-        current_session = context.session_manager.get(context.session_id)
+        current_session = context.current_session
         if not current_session or not current_session.parent_session_id:
             return None
 
-        parent = context.session_manager.get(current_session.parent_session_id)
+        parent = context.get_session(current_session.parent_session_id)
         if not parent or not parent.summary_markdown:
             return None
 
@@ -786,10 +879,9 @@ class ActionExecutor:
 
         if template:
             render_context = {
+                **context.render_context,
                 "summary": content,
                 "handoff": {"notes": "Restored summary"},
-                "session": current_session,
-                "state": context.state,
             }
             content = context.template_engine.render(template, render_context)
 
@@ -808,13 +900,14 @@ class ActionExecutor:
 
         session_id = context.session_id
         if target == "parent_session":
-            current_session = context.session_manager.get(context.session_id)
+            current_session = context.current_session
             if current_session and current_session.parent_session_id:
                 session_id = current_session.parent_session_id
             else:
                 return {"error": "No parent session linked"}
 
         context.session_manager.update_status(session_id, status)
+        context.invalidate_session(session_id)
         return {"status_updated": True, "session_id": session_id, "status": status}
 
     async def _handle_switch_mode(self, context: ActionContext, **kwargs) -> dict[str, Any] | None:
@@ -870,8 +963,6 @@ class ActionExecutor:
 
     def _get_git_status(self) -> str:
         """Get git status for current directory."""
-        import subprocess
-
         try:
             result = subprocess.run(
                 ["git", "status", "--short"],
@@ -885,8 +976,6 @@ class ActionExecutor:
 
     def _get_file_changes(self) -> str:
         """Get detailed file changes from git."""
-        import subprocess
-
         try:
             # Get changed files with status
             diff_result = subprocess.run(
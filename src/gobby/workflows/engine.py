@@ -387,7 +387,7 @@ class WorkflowEngine:
             if not action_type:
                 continue
 
-            logger.debug(f"Executing action '{action_type}' in workflow '{workflow.name}'")
+            logger.debug("Executing action '%s' in workflow '%s'", action_type, workflow.name)
             try:
                 kwargs = trigger.copy()
                 kwargs.pop("action", None)
@@ -501,7 +501,12 @@ class WorkflowEngine:
                 if context_data:
                     eval_ctx.update(context_data)
                 eval_result = self.evaluator.evaluate(when_condition, eval_ctx)
-                logger.debug(f"When condition '{when_condition}' evaluated to {eval_result}, event.data.reason={event.data.get('reason') if event.data else None}")
+                logger.debug(
+                    "When condition '%s' evaluated to %s, event.data.reason=%s",
+                    when_condition,
+                    eval_result,
+                    event.data.get("reason") if event.data else None,
+                )
                 if not eval_result:
                     continue
 
@@ -518,7 +523,13 @@ class WorkflowEngine:
                 kwargs.pop("when", None)
 
                 result = await self.action_executor.execute(action_type, action_ctx, **kwargs)
-                logger.debug(f"Action '{action_type}' returned: {type(result).__name__}, keys={list(result.keys()) if isinstance(result, dict) else 'N/A'}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Action '%s' returned: %s, keys=%s",
+                        action_type,
+                        type(result).__name__,
+                        list(result.keys()) if isinstance(result, dict) else "N/A",
+                    )
 
                 if result:
                     # Update context for subsequent actions
@@ -529,7 +540,10 @@ class WorkflowEngine:
                         state.variables.update(result)
 
                     if "inject_context" in result:
-                        logger.debug(f"Found inject_context in result, length={len(result['inject_context'])}")
+                        logger.debug(
+                            "Found inject_context in result, length=%d",
+                            len(result["inject_context"]),
+                        )
                         injected_context.append(result["inject_context"])
 
             except Exception as e:
@@ -1,10 +1,13 @@
 import logging
 from typing import Any
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import Environment, FileSystemLoader, Template, select_autoescape
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of compiled inline templates kept per engine
+_TEMPLATE_CACHE_SIZE = 256
+
 
 class TemplateEngine:
     """
@@ -24,12 +27,25 @@ class TemplateEngine:
             lstrip_blocks=True,
         )
 
+        # Workflows render the same inline templates repeatedly; compile each once
+        self._compiled: dict[str, Template] = {}
+
+    def _compile(self, template_str: str) -> Template:
+        """Compile a template string, reusing a previously compiled template."""
+        template = self._compiled.get(template_str)
+        if template is None:
+            template = self.env.from_string(template_str)
+            if len(self._compiled) >= _TEMPLATE_CACHE_SIZE:
+                self._compiled.clear()
+            self._compiled[template_str] = template
+        return template
+
     def render(self, template_str: str, context: dict[str, Any]) -> str:
         """
         Render a template string with the given context.
         """
         try:
-            template = self.env.from_string(template_str)
+            template = self._compile(template_str)
             return template.render(**context)
         except Exception as e:
             logger.error(f"Error rendering template: {e}", exc_info=True)
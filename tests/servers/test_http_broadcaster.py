@@ -14,7 +14,7 @@ from gobby.servers.http import HTTPServer
 
 
 @pytest.mark.asyncio
-async def test_execute_hook_broadcasts_event_client():
+async def test_execute_hook_broadcasts_event_client(tmp_path):
     # Setup config with broadcasting enabled
     config = DaemonConfig()
     config.hook_extensions = HookExtensionsConfig(
@@ -46,6 +46,8 @@ async def test_execute_hook_broadcasts_event_client():
             "input_data": {
                 "session_id": "test-session",
                 "project_path": "/tmp/test",
+                # Keep project auto-initialization out of the repository checkout
+                "cwd": str(tmp_path),
                 "resume": False,
                 "transcript_path": "/tmp/transcript.jsonl",
             },
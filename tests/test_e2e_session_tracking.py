@@ -47,7 +47,10 @@ async def env(tmp_path) -> AsyncGenerator[dict, None]:
         processor = SessionMessageProcessor(db, poll_interval=0.1, websocket_server=ws)  # type: ignore
 
         # Create HookManager
-        hm = HookManager(daemon_host="test", message_processor=processor, config=MagicMock())
+        # Write session summary files under tmp_path rather than a MagicMock-named dir in CWD
+        config = MagicMock()
+        config.session_summary.summary_file_path = str(tmp_path / "session_summaries")
+        hm = HookManager(daemon_host="test", message_processor=processor, config=config)
 
         # Force daemon status to be ready for tests
         hm._get_cached_daemon_status = MagicMock(return_value=(True, "OK", "running", None))  # type: ignore
@@ -4,7 +4,7 @@ from collections.abc import AsyncGenerator
 
 import pytest
 
-from gobby.sessions.processor import SessionMessageProcessor
+from gobby.sessions.processor import SessionMessageProcessor, _read_new_lines
 from gobby.storage.database import LocalDatabase
 
 
@@ -214,3 +214,230 @@ async def test_concurrent_sessions(processor, tmp_path, mock_db):
 
     assert len(rows2) == 1
     assert rows2[0]["content"] == "s2_msg"
+
+
+def test_read_new_lines_stops_at_incomplete_line(transcript_file):
+    complete = json.dumps({"type": "user", "message": {"content": "done"}}) + "\n"
+    with open(transcript_file, "w") as f:
+        f.write(complete)
+        f.write('{"type": "user", "mess')
+
+    lines, offset = _read_new_lines(str(transcript_file), 0)
+
+    assert lines == [complete]
+    assert offset == len(complete.encode("utf-8"))
+
+    # Resuming from the returned offset yields nothing until the line is finished
+    assert _read_new_lines(str(transcript_file), offset) == ([], offset)
+
+
+def test_read_new_lines_keeps_unicode_line_separators(transcript_file):
+    # U+2028 is valid unescaped inside a JSON string and must not split the line
+    first = json.dumps({"message": {"content": "a\u2028b \u00e9"}}, ensure_ascii=False) + "\n"
+    second = json.dumps({"message": {"content": "next"}}) + "\n"
+    transcript_file.write_text(first + second, encoding="utf-8")
+
+    lines, offset = _read_new_lines(str(transcript_file), 0)
+
+    assert lines == [first, second]
+    assert offset == len((first + second).encode("utf-8"))
+
+
+@pytest.mark.asyncio
+async def test_failing_session_does_not_block_others(processor, tmp_path, mock_db):
+    good = tmp_path / "good.jsonl"
+    good.write_text(json.dumps({"type": "user", "message": {"content": "ok"}}) + "\n")
+
+    processor.register_session("bad", str(tmp_path / "bad.jsonl"))
+    processor.register_session("good", str(good))
+
+    original = processor._process_session
+
+    async def flaky(session_id: str, transcript_path: str) -> None:
+        if session_id == "bad":
+            raise RuntimeError("boom")
+        await original(session_id, transcript_path)
+
+    processor._process_session = flaky
+    await processor._process_all_sessions()
+
+    rows = mock_db.fetchall("SELECT * FROM session_messages WHERE session_id='good'")
+    assert len(rows) == 1
+    assert rows[0]["content"] == "ok"
+
+
+@pytest.mark.asyncio
+async def test_unchanged_transcript_is_skipped(processor, transcript_file, mock_db, monkeypatch):
+    transcript_file.write_text(json.dumps({"type": "user", "message": {"content": "hi"}}) + "\n")
+    processor.register_session("session-1", str(transcript_file))
+    await processor._process_session("session-1", str(transcript_file))
+
+    calls = 0
+    original_get_state = processor.message_manager.get_state
+
+    async def counting_get_state(session_id: str):
+        nonlocal calls
+        calls += 1
+        return await original_get_state(session_id)
+
+    monkeypatch.setattr(processor.message_manager, "get_state", counting_get_state)
+
+    # Nothing changed on disk, so the DB state should not even be consulted
+    await processor._process_session("session-1", str(transcript_file))
+    assert calls == 0
+
+    with open(transcript_file, "a") as f:
+        f.write(json.dumps({"type": "user", "message": {"content": "again"}}) + "\n")
+
+    await processor._process_session("session-1", str(transcript_file))
+    assert calls == 1
+    rows = mock_db.fetchall("SELECT * FROM session_messages ORDER BY message_index")
+    assert [r["content"] for r in rows] == ["hi", "again"]
+
+
+@pytest.mark.asyncio
+async def test_file_watcher_reacts_before_poll_interval(mock_db, processor, transcript_file):
+    # Long poll interval: only a filesystem event can trigger processing in time
+    proc = SessionMessageProcessor(mock_db, poll_interval=30.0)
+    assert proc.use_file_watcher
+
+    proc.register_session("session-1", str(transcript_file))
+    await proc.start()
+    try:
+        await asyncio.sleep(0.2)
+        with open(transcript_file, "a") as f:
+            f.write(json.dumps({"type": "user", "message": {"content": "fast"}}) + "\n")
+
+        for _ in range(40):
+            await asyncio.sleep(0.05)
+            if mock_db.fetchall("SELECT * FROM session_messages"):
+                break
+
+        rows = mock_db.fetchall("SELECT * FROM session_messages")
+        assert [r["content"] for r in rows] == ["fast"]
+    finally:
+        await proc.stop()
+
+
+@pytest.mark.asyncio
+async def test_file_watcher_full_pass_despite_busy_sibling(mock_db, processor, tmp_path):
+    # An unregistered transcript next to session A keeps the watched directory busy,
+    # so the watcher never times out; session B's directory only appears later.
+    a_dir = tmp_path / "a"
+    a_dir.mkdir()
+    (a_dir / "a.jsonl").touch()
+    sibling = a_dir / "other.jsonl"
+    b_path = tmp_path / "b" / "b.jsonl"
+
+    proc = SessionMessageProcessor(mock_db, poll_interval=0.5)
+    proc.register_session("a", str(a_dir / "a.jsonl"))
+    await proc.start()
+
+    async def churn() -> None:
+        while True:
+            with open(sibling, "a") as f:
+                f.write("{}\n")
+            await asyncio.sleep(0.05)
+
+    churner = asyncio.create_task(churn())
+    try:
+        # Hooks register sessions from worker threads
+        await asyncio.to_thread(proc.register_session, "b", str(b_path))
+        await asyncio.sleep(0.3)
+        b_path.parent.mkdir()
+        b_path.write_text(json.dumps({"type": "user", "message": {"content": "late"}}) + "\n")
+
+        for _ in range(60):
+            await asyncio.sleep(0.05)
+            if mock_db.fetchall("SELECT * FROM session_messages WHERE session_id='b'"):
+                break
+
+        assert not churner.done()
+        rows = mock_db.fetchall("SELECT * FROM session_messages WHERE session_id='b'")
+        assert [r["content"] for r in rows] == ["late"]
+    finally:
+        churner.cancel()
+        await proc.stop()
+
+
+@pytest.mark.asyncio
+async def test_polling_fallback(mock_db, processor, transcript_file):
+    proc = SessionMessageProcessor(mock_db, poll_interval=0.1, use_file_watcher=False)
+    proc.register_session("session-1", str(transcript_file))
+    await proc.start()
+    try:
+        with open(transcript_file, "a") as f:
+            f.write(json.dumps({"type": "user", "message": {"content": "polled"}}) + "\n")
+        await asyncio.sleep(0.3)
+
+        rows = mock_db.fetchall("SELECT * FROM session_messages")
+        assert [r["content"] for r in rows] == ["polled"]
+    finally:
+        await proc.stop()
+
+
+def test_parsers_shared_per_source(processor, tmp_path):
+    processor.register_session("a", str(tmp_path / "a.jsonl"))
+    processor.register_session("b", str(tmp_path / "b.jsonl"))
+    processor.register_session("c", str(tmp_path / "c.jsonl"), source="gemini")
+
+    assert processor._parsers["a"] is processor._parsers["b"]
+    assert processor._parsers["a"] is not processor._parsers["c"]
+
+
+@pytest.mark.asyncio
+async def test_writer_survives_store_failure(processor, tmp_path, mock_db, monkeypatch):
+    for name in ("bad", "good"):
+        path = tmp_path / f"{name}.jsonl"
+        path.write_text(json.dumps({"type": "user", "message": {"content": name}}) + "\n")
+        processor.register_session(name, str(path))
+
+    original = processor.message_manager.store_and_advance
+
+    async def flaky_store(session_id: str, **kwargs):
+        if session_id == "bad":
+            raise RuntimeError("disk full")
+        return await original(session_id=session_id, **kwargs)
+
+    monkeypatch.setattr(processor.message_manager, "store_and_advance", flaky_store)
+    await processor._process_all_sessions()
+
+    rows = mock_db.fetchall("SELECT session_id, content FROM session_messages")
+    assert [(r["session_id"], r["content"]) for r in rows] == [("good", "good")]
+    # The failed batch is retried on the next pass rather than marked as seen
+    assert "bad" not in processor._stat_cache
+    assert "good" in processor._stat_cache
+
+    await processor.stop()
+    assert processor._writer_task is None
+
+
+async def test_slow_broadcast_does_not_block_writer(processor, tmp_path, mock_db):
+    paths = {}
+    for name in ("slow", "fast"):
+        path = tmp_path / f"{name}.jsonl"
+        path.write_text(json.dumps({"type": "user", "message": {"content": name}}) + "\n")
+        processor.register_session(name, str(path))
+        paths[name] = str(path)
+
+    broadcasting = asyncio.Event()
+    release = asyncio.Event()
+
+    class StalledWebSocket:
+        async def broadcast(self, payload):
+            if payload["session_id"] == "slow":
+                broadcasting.set()
+                await release.wait()
+
+    processor.websocket_server = StalledWebSocket()
+
+    slow = asyncio.create_task(processor._process_session("slow", paths["slow"]))
+    await asyncio.wait_for(broadcasting.wait(), timeout=1.0)
+
+    # The writer is free while the slow session's clients are still being served
+    await asyncio.wait_for(processor._process_session("fast", paths["fast"]), timeout=1.0)
+    rows = mock_db.fetchall("SELECT session_id FROM session_messages ORDER BY session_id")
+    assert [r["session_id"] for r in rows] == ["fast", "slow"]
+
+    release.set()
+    await slow
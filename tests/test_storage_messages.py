@@ -1,3 +1,4 @@
+import sqlite3
 from datetime import datetime
 from unittest.mock import MagicMock
 
@@ -152,3 +153,47 @@ async def test_update_state(manager, mock_db):
     assert params[0] == "s1"
     assert params[1] == 200  # byte_offset
     assert params[2] == 10  # message_index
+
+
+@pytest.mark.asyncio
+async def test_store_and_advance_single_transaction(sample_message, tmp_path):
+    db = LocalDatabase(tmp_path / "messages.db")
+    db.execute("""
+        CREATE TABLE session_messages (
+            session_id TEXT NOT NULL,
+            message_index INTEGER NOT NULL,
+            role TEXT NOT NULL,
+            content TEXT NOT NULL,
+            content_type TEXT,
+            tool_name TEXT,
+            tool_input TEXT,
+            tool_result TEXT,
+            timestamp TEXT NOT NULL,
+            raw_json TEXT,
+            UNIQUE(session_id, message_index)
+        )
+    """)
+    db.execute("""
+        CREATE TABLE session_message_state (
+            session_id TEXT PRIMARY KEY,
+            last_byte_offset INTEGER,
+            last_message_index INTEGER,
+            last_processed_at TEXT,
+            updated_at TEXT
+        )
+    """)
+    manager = LocalMessageManager(db)
+
+    count = await manager.store_and_advance("s1", [sample_message], byte_offset=42, message_index=1)
+
+    assert count == 1
+    assert db.fetchone("SELECT content FROM session_messages")["content"] == "Hello"
+    state = await manager.get_state("s1")
+    assert state["last_byte_offset"] == 42
+    assert state["last_message_index"] == 1
+
+    # A failing write rolls back the state update too
+    db.execute("DROP TABLE session_messages")
+    with pytest.raises(sqlite3.OperationalError):
+        await manager.store_and_advance("s1", [sample_message], byte_offset=99, message_index=2)
+    assert (await manager.get_state("s1"))["last_byte_offset"] == 42
@@ -100,3 +100,49 @@ class TestSessionTaskManager:
         actions = {t["action"] for t in tasks}
         assert "mentioned" in actions
         assert "worked_on" in actions
+
+    def test_link_tasks_bulk(
+        self, session_task_manager, task_manager, sample_session, sample_project
+    ):
+        t1 = task_manager.create_task(project_id=sample_project["id"], title="Task 1")
+        t2 = task_manager.create_task(project_id=sample_project["id"], title="Task 2")
+
+        session_task_manager.link_tasks(
+            sample_session.id,
+            [(t1.id, "worked_on"), (t2.id, "discovered"), (t1.id, "worked_on")],
+        )
+
+        tasks = session_task_manager.get_session_tasks(sample_session.id)
+        assert {(t["task"].id, t["action"]) for t in tasks} == {
+            (t1.id, "worked_on"),
+            (t2.id, "discovered"),
+        }
+
+    def test_link_tasks_invalid_action_links_nothing(
+        self, session_task_manager, sample_task, sample_session
+    ):
+        with pytest.raises(ValueError, match="Invalid action"):
+            session_task_manager.link_tasks(
+                sample_session.id, [(sample_task.id, "worked_on"), (sample_task.id, "bogus")]
+            )
+
+        assert session_task_manager.get_session_tasks(sample_session.id) == []
+
+    def test_link_stores_integer_timestamp(
+        self, session_task_manager, task_manager, sample_session, sample_project
+    ):
+        t1 = task_manager.create_task(project_id=sample_project["id"], title="Older")
+        t2 = task_manager.create_task(project_id=sample_project["id"], title="Newer")
+
+        with patch("gobby.storage.session_tasks.time.time_ns", return_value=1_000_000_000_000):
+            session_task_manager.link_task(sample_session.id, t1.id, "worked_on")
+        with patch("gobby.storage.session_tasks.time.time_ns", return_value=2_000_123_456_789):
+            session_task_manager.link_task(sample_session.id, t2.id, "worked_on")
+
+        tasks = session_task_manager.get_session_tasks(sample_session.id)
+        assert [t["task"].id for t in tasks] == [t2.id, t1.id]
+        assert tasks[0]["link_created_at"] == "1970-01-01T00:33:20.123456+00:00"
+        assert tasks[1]["link_created_at"] == "1970-01-01T00:16:40.000000+00:00"
+
+        links = session_task_manager.get_task_sessions(t1.id)
+        assert links[0]["created_at_us"] == 1_000_000_000
@@ -1,5 +1,7 @@
 """Tests for the LocalSessionManager storage layer."""
 
+from unittest.mock import patch
+
 from gobby.storage.sessions import LocalSessionManager, Session
 
 
@@ -125,6 +127,103 @@ class TestLocalSessionManager:
         assert retrieved.id == created.id
         assert retrieved.external_id == "get-test"
 
+    def test_get_session_cached_until_write(
+        self,
+        session_manager: LocalSessionManager,
+        sample_project: dict,
+    ):
+        """Test repeated gets are served from cache and writes invalidate it."""
+        created = session_manager.register(
+            external_id="cache-test",
+            machine_id="machine",
+            source="claude",
+            project_id=sample_project["id"],
+        )
+
+        with patch.object(
+            session_manager.db, "fetchone", wraps=session_manager.db.fetchone
+        ) as fetchone:
+            first = session_manager.get(created.id)
+            assert session_manager.get(created.id) is first
+            assert fetchone.call_count == 1
+
+            session_manager.update_status(created.id, "paused")
+            assert session_manager.get(created.id).status == "paused"
+
+    def test_get_session_cache_shared_across_managers(
+        self,
+        session_manager: LocalSessionManager,
+        sample_project: dict,
+    ):
+        """Test writes through another manager on the same database invalidate at once."""
+        created = session_manager.register(
+            external_id="shared-cache-test",
+            machine_id="machine",
+            source="claude",
+            project_id=sample_project["id"],
+        )
+        other = LocalSessionManager(session_manager.db)
+
+        assert session_manager.get(created.id).status == "active"
+        other.update_status(created.id, "handoff_ready")
+        assert session_manager.get(created.id).status == "handoff_ready"
+
+        other.update_summary(created.id, summary_markdown="Shared")
+        assert session_manager.get(created.id).summary_markdown == "Shared"
+
+    def test_get_session_does_not_cache_row_read_before_write(
+        self,
+        session_manager: LocalSessionManager,
+        sample_project: dict,
+    ):
+        """Test a write landing during a cache-miss read keeps the old row out of the cache."""
+        created = session_manager.register(
+            external_id="race-test",
+            machine_id="machine",
+            source="claude",
+            project_id=sample_project["id"],
+        )
+        other = LocalSessionManager(session_manager.db)
+        fetchone = session_manager.db.fetchone
+        raced = []
+
+        def fetch_then_write(*args):
+            row = fetchone(*args)
+            if not raced:
+                # Another thread updates (and invalidates) after the old row was read
+                raced.append(True)
+                other.update_status(created.id, "paused")
+            return row
+
+        with patch.object(session_manager.db, "fetchone", side_effect=fetch_then_write):
+            assert session_manager.get(created.id).status == "active"
+
+        assert session_manager.get(created.id).status == "paused"
+
+    def test_get_session_cache_expires(
+        self,
+        session_manager: LocalSessionManager,
+        sample_project: dict,
+    ):
+        """Test out-of-band writes become visible once the TTL lapses."""
+        created = session_manager.register(
+            external_id="ttl-test",
+            machine_id="machine",
+            source="claude",
+            project_id=sample_project["id"],
+        )
+
+        with patch("gobby.storage.sessions.time.monotonic", return_value=1000.0):
+            assert session_manager.get(created.id).title is None
+            # Simulate another process writing to the database file directly
+            session_manager.db.execute(
+                "UPDATE sessions SET title = ? WHERE id = ?", ("Renamed", created.id)
+            )
+            assert session_manager.get(created.id).title is None
+
+        with patch("gobby.storage.sessions.time.monotonic", return_value=1010.0):
+            assert session_manager.get(created.id).title == "Renamed"
+
     def test_get_nonexistent(self, session_manager: LocalSessionManager):
         """Test getting nonexistent session returns None."""
         result = session_manager.get("nonexistent-id")
@@ -264,6 +363,56 @@ class TestLocalSessionManager:
         assert updated is not None
         assert updated.summary_path == "/path/to/summary.md"
         assert updated.summary_markdown == "# Summary\nThis is a test."
+        assert updated.status == session.status
+
+    def test_get_parent_summary(
+        self,
+        session_manager: LocalSessionManager,
+        sample_project: dict,
+    ):
+        """Test reading the parent's summary through the child session."""
+        parent = session_manager.register(
+            external_id="parent-summary",
+            machine_id="machine",
+            source="claude",
+            project_id=sample_project["id"],
+        )
+        child = session_manager.register(
+            external_id="child-summary",
+            machine_id="machine",
+            source="claude",
+            project_id=sample_project["id"],
+        )
+
+        assert session_manager.get_parent_summary(child.id) is None
+
+        session_manager.update_parent_session_id(child.id, parent.id)
+        assert session_manager.get_parent_summary(child.id) is None
+
+        session_manager.update_summary(parent.id, summary_markdown="Parent work")
+        assert session_manager.get_parent_summary(child.id) == "Parent work"
+        assert session_manager.get_parent_summary("missing") is None
+
+    def test_update_summary_with_status(
+        self,
+        session_manager: LocalSessionManager,
+        sample_project: dict,
+    ):
+        """Test updating summary and status in one write."""
+        session = session_manager.register(
+            external_id="summary-status-test",
+            machine_id="machine",
+            source="claude",
+            project_id=sample_project["id"],
+        )
+
+        updated = session_manager.update_summary(
+            session.id, summary_markdown="Handoff", status="handoff_ready"
+        )
+
+        assert updated is not None
+        assert updated.summary_markdown == "Handoff"
+        assert updated.status == "handoff_ready"
 
     def test_list_sessions(
         self,
@@ -79,6 +79,13 @@ class TestLocalTaskManager:
         assert len(tasks_p1) == 1
         assert tasks_p1[0].id == t1.id
 
+    def test_iter_tasks_sorted_by_id(self, task_manager, project_id):
+        created = [task_manager.create_task(project_id, f"Task {i}") for i in range(5)]
+
+        tasks = list(task_manager.iter_tasks_sorted_by_id())
+
+        assert [t.id for t in tasks] == sorted(t.id for t in created)
+
     def test_id_collision_retry(self, task_manager, project_id):
         # Create a task to occupy an ID
         existing_task = task_manager.create_task(project_id=project_id, title="Existing")
@@ -1,11 +1,13 @@
+import asyncio
+import hashlib
 import json
-import time
-import pytest
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-from gobby.sync.tasks import TaskSyncManager
+import pytest
+
 from gobby.storage.tasks import LocalTaskManager
+from gobby.sync.tasks import TaskSyncManager
 
 
 @pytest.fixture
@@ -54,12 +56,38 @@ class TestTaskSyncManager:
         assert task2_data["title"] == "Task 2"
         assert task2_data["deps_on"] == [t1.id]
 
-    def test_trigger_export_debounced(self, sync_manager):
-        # Mock export_to_jsonl
-        # We need to patch the method on the instance or class
-        # Using a safer approach with a mock side_effect check in a real scenario would be better,
-        # but for threading, we just want to ensure it runs eventually.
+    def test_export_multiple_deps_sorted(self, sync_manager, task_manager, sample_project):
+        blockers = [
+            task_manager.create_task(sample_project["id"], f"Blocker {i}") for i in range(3)
+        ]
+        task = task_manager.create_task(sample_project["id"], "Blocked")
+        for blocker in reversed(blockers):
+            sync_manager.db.execute(
+                "INSERT INTO task_dependencies (task_id, depends_on, dep_type, created_at) VALUES (?, ?, ?, ?)",
+                (task.id, blocker.id, "blocks", "2023-01-01T00:00:00"),
+            )
+
+        sync_manager.export_to_jsonl()
+
+        lines = sync_manager.export_path.read_text().strip().split("\n")
+        data = {d["id"]: d for d in map(json.loads, lines)}
+        assert data[task.id]["deps_on"] == sorted(b.id for b in blockers)
+
+    def test_export_hash_matches_file(self, sync_manager, task_manager, sample_project):
+        task_manager.create_task(sample_project["id"], "Task 1")
+        task_manager.create_task(sample_project["id"], "Task 2")
+
+        sync_manager.export_to_jsonl()
+
+        meta = json.loads((sync_manager.export_path.parent / "tasks_meta.json").read_text())
+        content = sync_manager.export_path.read_bytes()
+        assert meta["content_hash"] == hashlib.sha256(content).hexdigest()
+
+        # Lines are written with sorted keys so the file is the canonical hashed form
+        for line in content.decode("utf-8").splitlines():
+            assert line == json.dumps(json.loads(line), sort_keys=True)
 
+    async def test_trigger_export_debounced(self, sync_manager):
         # Reduce interval for test
         sync_manager._debounce_interval = 0.1
 
@@ -70,12 +98,56 @@ class TestTaskSyncManager:
 
             assert mock_export.call_count == 0
 
-            time.sleep(0.2)
+            await asyncio.sleep(0.3)
+
+            assert mock_export.call_count == 1
+
+            # A later trigger reuses the same exporter task
+            task = sync_manager._export_task
+            sync_manager.trigger_export()
+            await asyncio.sleep(0.3)
+
+            assert mock_export.call_count == 2
+            assert sync_manager._export_task is task
 
+        sync_manager.stop()
+
+    async def test_trigger_export_from_worker_thread(self, sync_manager):
+        sync_manager._debounce_interval = 0.05
+
+        sync_manager.start()
+
+        with patch.object(sync_manager, "export_to_jsonl") as mock_export:
+            # Debounced on the bound loop even without a prior trigger from it
+            await asyncio.to_thread(sync_manager.trigger_export)
+            assert mock_export.call_count == 0
+
+            await asyncio.sleep(0.2)
             assert mock_export.call_count == 1
 
         sync_manager.stop()
 
+    async def test_stop_flushes_pending_export(self, sync_manager):
+        sync_manager._debounce_interval = 10.0
+
+        with patch.object(sync_manager, "export_to_jsonl") as mock_export:
+            sync_manager.trigger_export()
+            await asyncio.sleep(0.05)
+            assert mock_export.call_count == 0
+
+            sync_manager.stop()
+            assert mock_export.call_count == 1
+
+            # Nothing left to flush
+            sync_manager.stop()
+            assert mock_export.call_count == 1
+
+    def test_trigger_export_without_event_loop(self, sync_manager):
+        with patch.object(sync_manager, "export_to_jsonl") as mock_export:
+            sync_manager.trigger_export()
+
+            mock_export.assert_called_once()
+
     def test_mutation_triggers_export(self, task_manager, tmp_path, sample_project):
         """Test that task mutations trigger export."""
         export_path = tmp_path / "tasks.jsonl"
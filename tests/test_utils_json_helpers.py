@@ -0,0 +1,29 @@
+"""Tests for src/utils/json_helpers.py - LLM JSON extraction."""
+
+import json
+
+import pytest
+
+from gobby.utils.json_helpers import extract_json
+
+
+class TestExtractJson:
+    """Tests for extract_json."""
+
+    def test_plain_json(self):
+        assert extract_json('[{"title": "a"}]') == [{"title": "a"}]
+
+    def test_fenced_json(self):
+        content = '```json\n{"status": "valid", "feedback": "ok"}\n```'
+        assert extract_json(content) == {"status": "valid", "feedback": "ok"}
+
+    def test_fenced_without_language(self):
+        assert extract_json("```\n[1, 2]\n```") == [1, 2]
+
+    def test_json_surrounded_by_prose(self):
+        content = 'Here are the subtasks:\n[{"title": "a"}, {"title": "b"}]\nLet me know!'
+        assert extract_json(content) == [{"title": "a"}, {"title": "b"}]
+
+    def test_no_json_raises(self):
+        with pytest.raises(json.JSONDecodeError):
+            extract_json("I could not do that.")
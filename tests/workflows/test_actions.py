@@ -1,4 +1,6 @@
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -105,9 +107,72 @@ async def test_capture_artifact(action_executor, action_context, tmp_path):
     )
 
     assert result is not None
-    assert result["captured"] == str(artifact_file)
+    assert result["captured"] == os.path.realpath(artifact_file)
     assert "current_plan" in action_context.state.artifacts
-    assert action_context.state.artifacts["current_plan"] == str(artifact_file)
+    assert action_context.state.artifacts["current_plan"] == os.path.realpath(artifact_file)
+
+
+@pytest.mark.asyncio
+async def test_capture_artifact_recursive_pattern(action_executor, action_context, tmp_path):
+    nested = tmp_path / "docs" / "plans"
+    nested.mkdir(parents=True)
+    artifact_file = nested / "plan.md"
+    artifact_file.write_text("Plan content")
+
+    result = await action_executor.execute(
+        "capture_artifact", action_context, pattern=str(tmp_path / "**" / "plan.md")
+    )
+
+    assert result == {"captured": os.path.realpath(artifact_file)}
+
+
+@pytest.mark.asyncio
+async def test_capture_artifact_cached_match_revalidated(action_executor, action_context, tmp_path):
+    first = tmp_path / "a_plan.md"
+    first.write_text("A")
+    pattern = str(tmp_path / "*_plan.md")
+
+    result = await action_executor.execute("capture_artifact", action_context, pattern=pattern)
+    assert result == {"captured": os.path.realpath(first)}
+
+    # A deleted cached match falls back to a fresh glob
+    first.unlink()
+    second = tmp_path / "b_plan.md"
+    second.write_text("B")
+
+    result = await action_executor.execute("capture_artifact", action_context, pattern=pattern)
+    assert result == {"captured": os.path.realpath(second)}
+
+
+@pytest.mark.asyncio
+async def test_capture_artifact_flat_pattern(
+    action_executor, action_context, tmp_path, monkeypatch
+):
+    (tmp_path / ".hidden.md").write_text("hidden")
+    (tmp_path / "notes.txt").write_text("not markdown")
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "spec.md").write_text("spec")
+    monkeypatch.chdir(tmp_path)
+
+    # Hidden files are skipped unless the pattern asks for them, as with glob
+    result = await action_executor.execute("capture_artifact", action_context, pattern="*.md")
+    assert result is None
+
+    result = await action_executor.execute("capture_artifact", action_context, pattern=".*.md")
+    assert result == {"captured": os.path.realpath(tmp_path / ".hidden.md")}
+
+    result = await action_executor.execute("capture_artifact", action_context, pattern="docs/*.md")
+    assert result == {"captured": os.path.realpath(docs / "spec.md")}
+
+
+@pytest.mark.asyncio
+async def test_capture_artifact_no_match(action_executor, action_context, tmp_path):
+    result = await action_executor.execute(
+        "capture_artifact", action_context, pattern=str(tmp_path / "**" / "missing.md")
+    )
+
+    assert result is None
 
 
 @pytest.mark.asyncio
@@ -316,3 +381,95 @@ async def test_mark_todo_complete(action_executor, action_context, tmp_path):
     content = todo_file.read_text()
     assert "- [x] Task A" in content
     assert "- [ ] Task B" in content
+
+
+@pytest.mark.asyncio
+async def test_session_lookups_cached_per_context(
+    action_executor, action_context, session_manager, sample_project
+):
+    parent = session_manager.register(
+        external_id="cache-parent",
+        machine_id="test-machine",
+        source="test-source",
+        project_id=sample_project["id"],
+    )
+    session_manager.update_summary(parent.id, summary_markdown="Parent Summary")
+    session_manager.update_status(parent.id, "handoff_ready")
+    current = session_manager.register(
+        external_id="cache-current",
+        machine_id="test-machine",
+        source="test-source",
+        project_id=sample_project["id"],
+    )
+    action_context.session_id = current.id
+
+    with patch.object(session_manager, "get", wraps=session_manager.get) as get_spy:
+        await action_executor.execute("inject_message", action_context, content="a")
+        await action_executor.execute("inject_message", action_context, content="b")
+        assert get_spy.call_count == 1
+
+        # Linking a parent invalidates the cached session, so restore sees the link
+        result = await action_executor.execute("find_parent_session", action_context)
+        assert result["parent_session_id"] == parent.id
+
+        result = await action_executor.execute("restore_context", action_context)
+        assert result == {"inject_context": "Parent Summary"}
+
+
+@pytest.mark.asyncio
+async def test_inject_message_uses_shared_render_context(action_executor, action_context):
+    action_context.template_engine = TemplateEngine()
+    action_context.state.observations = [{"tool": "Edit"}]
+    action_context.state.variables = {"name": "gobby"}
+
+    template = "{{ variables.name }}/{{ observations | length }}/{{ extra }}"
+    result = await action_executor.execute(
+        "inject_message", action_context, content=template, extra="x"
+    )
+    assert result == {"inject_message": "gobby/1/x"}
+
+    # The compiled template is reused, and later state changes are still visible
+    action_context.state.variables["name"] = "again"
+    with patch.object(action_context.template_engine.env, "from_string") as from_string:
+        result = await action_executor.execute(
+            "inject_message", action_context, content=template, extra="y"
+        )
+    from_string.assert_not_called()
+    assert result == {"inject_message": "again/1/y"}
+
+
+@pytest.mark.asyncio
+async def test_execute_dispatch(action_executor, action_context):
+    assert await action_executor.execute("no_such_action", action_context) is None
+
+    async def boom(context, **kwargs):
+        raise RuntimeError("boom")
+
+    # Handlers registered after construction are dispatched too
+    action_executor.register("boom", boom)
+    assert await action_executor.execute("boom", action_context) == {"error": "boom"}
+
+
+@pytest.mark.asyncio
+async def test_execute_many_runs_concurrently(action_executor, action_context):
+    release = asyncio.Event()
+    started = []
+
+    async def waiter(context, **kwargs):
+        started.append(kwargs["name"])
+        if len(started) == 2:
+            release.set()
+        await release.wait()
+        return {"done": kwargs["name"]}
+
+    action_executor.register("waiter", waiter)
+
+    results = await asyncio.wait_for(
+        action_executor.execute_many(
+            [("waiter", {"name": "a"}), ("no_such_action", {}), ("waiter", {"name": "b"})],
+            action_context,
+        ),
+        timeout=1,
+    )
+
+    assert results == [{"done": "a"}, None, {"done": "b"}]
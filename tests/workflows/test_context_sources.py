@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, PropertyMock
 
 import pytest
 
@@ -11,6 +11,13 @@ def mock_context():
     context = MagicMock(spec=ActionContext)
     context.session_id = "test-session"
     context.session_manager = MagicMock()
+    context.get_session.side_effect = lambda sid: context.session_manager.get(sid)
+    type(context).current_session = PropertyMock(
+        side_effect=lambda: context.session_manager.get(context.session_id)
+    )
+    type(context).render_context = PropertyMock(
+        side_effect=lambda: ActionContext.render_context.fget(context)
+    )
     context.template_engine = MagicMock()
     context.template_engine.render.side_effect = lambda t, c: t  # specific render mock if needed
 
@@ -29,16 +36,8 @@ async def test_inject_context_previous_session_summary(mock_context):
         template_engine=mock_context.template_engine,
     )
 
-    # Mock current session with parent
-    current_session = MagicMock()
-    current_session.parent_session_id = "parent-123"
-    mock_context.session_manager.get.side_effect = (
-        lambda sid: current_session if sid == "test-session" else parent_session
-    )
-
-    # Mock parent session with summary
-    parent_session = MagicMock()
-    parent_session.summary_markdown = "Summary of previous session"
+    # Mock parent session summary lookup
+    mock_context.session_manager.get_parent_summary.return_value = "Summary of previous session"
 
     # Execute action
     result = await executor.execute(
@@ -47,6 +46,7 @@ async def test_inject_context_previous_session_summary(mock_context):
 
     assert result == {"inject_context": "Summary of previous session"}
     assert mock_context.state.context_injected is True
+    mock_context.session_manager.get_parent_summary.assert_called_once_with("test-session")
 
 
 @pytest.mark.asyncio
@@ -71,6 +71,16 @@ async def test_inject_context_artifacts(mock_context):
     assert result is not None
     assert result["inject_context"] == expected_content
 
+    # Without a template, no render context (and no session lookup) is built
+    mock_context.session_manager.get.assert_not_called()
+    mock_context.template_engine.render.assert_not_called()
+
+    result = await executor.execute(
+        "inject_context", mock_context, source="artifacts", template="{{ artifacts_list }}"
+    )
+    mock_context.session_manager.get.assert_called_once_with("test-session")
+    mock_context.template_engine.render.assert_called_once()
+
 
 @pytest.mark.asyncio
 async def test_inject_context_observations(mock_context):
@@ -103,3 +113,21 @@ async def test_inject_context_workflow_state(mock_context):
     assert result is not None
     assert "## Workflow State" in result["inject_context"]
     assert '"workflow_name": "test-workflow"' in result["inject_context"]
+
+
+@pytest.mark.asyncio
+async def test_inject_context_unknown_source(mock_context):
+    executor = ActionExecutor(
+        db=MagicMock(),
+        session_manager=mock_context.session_manager,
+        template_engine=mock_context.template_engine,
+    )
+
+    result = await executor.execute(
+        "inject_context", mock_context, source="nonexistent", template="{{ summary }}"
+    )
+
+    assert result is None
+    assert mock_context.state.context_injected is False
+    mock_context.session_manager.get.assert_not_called()
+    mock_context.template_engine.render.assert_not_called()